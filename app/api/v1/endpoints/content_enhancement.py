@@ -49,6 +49,15 @@ class ImproveRequest(BaseModel):
     text: str = Field(..., min_length=1, description="Text to improve")
 
 
+class MultiEnhanceRequest(BaseModel):
+    """Request to apply several enhancements to the same text."""
+    text: str = Field(..., min_length=1, description="Text to enhance")
+    enhancement_types: List[str] = Field(
+        ..., min_items=1, max_items=5, description="Enhancement types (grammar, tone, seo, summarize, improve)"
+    )
+    context: Optional[str] = Field(None, description="Additional context (e.g. target tone or keywords)")
+
+
 class BatchEnhanceRequest(BaseModel):
     """Request to batch enhance content."""
     requests: List[dict] = Field(..., min_items=1, max_items=10, description="Enhancement requests")
@@ -211,6 +220,41 @@ async def improve_content(
         )
 
 
+@router.post(
+    "/enhance/multi",
+    response_model=List[dict],
+    status_code=status.HTTP_201_CREATED,
+    summary="Apply multiple enhancements",
+    description="Apply several enhancement types to the same text concurrently",
+)
+async def multi_enhance(
+    request: MultiEnhanceRequest,
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply multiple enhancements to the same text."""
+    try:
+        results = await ContentEnhancementService.enhance_content_multi(
+            db=db,
+            text=request.text,
+            enhancement_types=request.enhancement_types,
+            context=request.context,
+            created_by=UUID(str(user.user_id)),
+        )
+        return results
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Error applying multiple enhancements: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to enhance content: {str(e)}",
+        )
+
+
 @router.post(
     "/enhance/batch",
     response_model=List[EnhancementResponse],
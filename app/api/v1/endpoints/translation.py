@@ -35,6 +35,9 @@ class BatchTranslateRequest(BaseModel):
     texts: List[str] = Field(..., min_items=1, max_items=50, description="Texts to translate")
     source_lang: str = Field(..., description="Source language")
     target_lang: str = Field(..., description="Target language")
+    strict_individual: bool = Field(
+        False, description="Translate each text with a separate AI call instead of one batched call"
+    )
 
 
 class AutoTranslateRequest(BaseModel):
@@ -133,8 +136,14 @@ async def batch_translate(
             source_lang=request.source_lang,
             target_lang=request.target_lang,
             created_by=UUID(str(user.user_id)),
+            strict_individual=request.strict_individual,
         )
         return results
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Error in batch translation: {e}")
         raise HTTPException(
@@ -5,6 +5,7 @@ translation, enhancement, and other AI operations.
 """
 
 import asyncio
+import json
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -26,6 +27,13 @@ class AbacusAIClient:
     - Image generation (if available)
     """
     
+    LANGUAGE_NAMES = {
+        "en": "English",
+        "es": "Spanish",
+        "fr": "French",
+        "pt": "Portuguese",
+    }
+    
     def __init__(self):
         """Initialize Abacus.AI client."""
         self.client = abacusai.ApiClient()
@@ -102,12 +110,7 @@ class AbacusAIClient:
         Raises:
             ApiException: If translation fails
         """
-        lang_names = {
-            "en": "English",
-            "es": "Spanish",
-            "fr": "French",
-            "pt": "Portuguese",
-        }
+        lang_names = self.LANGUAGE_NAMES
         
         prompt = f"""Translate the following text from {lang_names.get(source_lang, source_lang)} to {lang_names.get(target_lang, target_lang)}.
 Provide ONLY the translation, no explanations.
@@ -129,13 +132,84 @@ Translation:"""
             "quality_score": 0.85,  # Default quality score
         }
     
-    async def enhance_text(
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+    ) -> List[Dict[str, Any]]:
+        """Translate several texts with a single Abacus.AI call.
+        
+        The texts are sent as a JSON array and the model is asked to answer
+        with a JSON array of the same length. If the response can't be
+        matched back to the inputs, each text is translated individually.
+        
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code (en, es, fr, pt)
+            target_lang: Target language code (en, es, fr, pt)
+            
+        Returns:
+            List aligned with texts; each item has 'translated_text',
+            'tokens_used', 'quality_score' keys
+            
+        Raises:
+            ApiException: If translation fails
+        """
+        if not texts:
+            return []
+        
+        lang_names = self.LANGUAGE_NAMES
+        
+        prompt = f"""Translate each string in the following JSON array from {lang_names.get(source_lang, source_lang)} to {lang_names.get(target_lang, target_lang)}.
+Respond with ONLY a JSON array of the translations, in the same order and with the same number of items.
+
+Texts to translate:
+{json.dumps(texts, ensure_ascii=False)}
+
+Translations:"""
+        
+        result = await self.generate_text(
+            prompt=prompt,
+            max_tokens=settings.AI_MAX_TOKENS,
+            temperature=0.3,
+            system_message="You are a professional translator.",
+        )
+        
+        raw = result["text"]
+        try:
+            translations = json.loads(raw[raw.find("["):raw.rfind("]") + 1])
+        except ValueError:
+            translations = None
+        
+        if not (
+            isinstance(translations, list)
+            and len(translations) == len(texts)
+            and all(isinstance(translation, str) for translation in translations)
+        ):
+            logger.warning("Batch translation response did not match the inputs, translating individually")
+            return list(await asyncio.gather(*(
+                self.translate_text(text, source_lang, target_lang)
+                for text in texts
+            )))
+        
+        tokens_per_text = result["tokens_used"] // len(texts)
+        return [
+            {
+                "translated_text": translation.strip(),
+                "tokens_used": tokens_per_text,
+                "quality_score": 0.85,  # Default quality score
+            }
+            for translation in translations
+        ]
+    
+    def build_enhancement_request(
         self,
         text: str,
         enhancement_type: str,
         additional_context: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Enhance text using Abacus.AI.
+        """Build the generate_text arguments for a text enhancement.
         
         Args:
             text: Text to enhance
@@ -143,10 +217,7 @@ Translation:"""
             additional_context: Additional context for enhancement
             
         Returns:
-            Dict with 'enhanced_text', 'tokens_used', 'changes_made' keys
-            
-        Raises:
-            ApiException: If enhancement fails
+            Dict with 'prompt', 'temperature', 'system_message' keys
         """
         enhancement_prompts = {
             "grammar": "Fix all grammar, spelling, and punctuation errors in the following text. Keep the same tone and style:",
@@ -158,18 +229,53 @@ Translation:"""
         
         prompt = f"{enhancement_prompts.get(enhancement_type, enhancement_prompts['improve'])}\n\n{text}\n\nEnhanced version:"
         
-        result = await self.generate_text(
-            prompt=prompt,
-            temperature=0.5,
-            system_message="You are an expert editor and content strategist.",
-        )
+        return {
+            "prompt": prompt,
+            "temperature": 0.5,
+            "system_message": "You are an expert editor and content strategist.",
+        }
+    
+    @staticmethod
+    def parse_enhancement_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a generate_text result into an enhancement result.
         
+        Args:
+            result: Result returned by generate_text
+            
+        Returns:
+            Dict with 'enhanced_text', 'tokens_used', 'model_used', 'changes_made' keys
+        """
         return {
             "enhanced_text": result["text"].strip(),
             "tokens_used": result["tokens_used"],
+            "model_used": result.get("model_used"),
             "changes_made": ["Enhanced"],  # Could be more detailed
         }
     
+    async def enhance_text(
+        self,
+        text: str,
+        enhancement_type: str,
+        additional_context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Enhance text using Abacus.AI.
+        
+        Args:
+            text: Text to enhance
+            enhancement_type: Type of enhancement (grammar, tone, seo, summarize, improve)
+            additional_context: Additional context for enhancement
+            
+        Returns:
+            Dict with 'enhanced_text', 'tokens_used', 'changes_made' keys
+            
+        Raises:
+            ApiException: If enhancement fails
+        """
+        result = await self.generate_text(
+            **self.build_enhancement_request(text, enhancement_type, additional_context)
+        )
+        return self.parse_enhancement_result(result)
+    
     async def generate_image(
         self,
         prompt: str,
@@ -182,7 +288,8 @@ Translation:"""
             size: Image size (e.g., "1024x1024", "512x512")
             
         Returns:
-            Dict with 'image_url', 'size', 'format' keys
+            Dict with 'image_url', 'size', 'format' keys, and 'placeholder'
+            set when no image was actually generated
             
         Note:
             This is a placeholder. Implement with actual image generation API
@@ -194,6 +301,7 @@ Translation:"""
             "image_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/6/65/No-Image-Placeholder.svg/975px-No-Image-Placeholder.svg.png",
             "size": size,
             "format": "jpg",
+            "placeholder": True,
         }
     
     async def batch_generate(
@@ -0,0 +1,70 @@
+"""In-process caching utilities.
+
+Provides a bounded LRU cache for memoizing deterministic AI results such as
+translations and generated images.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a compact cache key from string parts.
+
+    Args:
+        parts: Key components; free-form text should come last
+
+    Returns:
+        Hex digest identifying the parts
+    """
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not cached
+        """
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -7,7 +7,7 @@ Different configurations can be used for dev/staging/prod environments.
 import secrets
 from typing import List, Optional
 
-from pydantic import AnyHttpUrl, field_validator
+from pydantic import AnyHttpUrl, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -62,6 +62,7 @@ class Settings(BaseSettings):
     
     # Redis (for caching, sessions, etc.)
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # seconds; a slow Redis counts as a cache miss
     
     # Kafka (for event-driven architecture)
     KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
@@ -86,6 +87,7 @@ class Settings(BaseSettings):
     AI_MAX_TOKENS: int = 2000
     AI_TEMPERATURE: float = 0.7
     AI_TIMEOUT: int = 60  # seconds
+    TRANSLATION_MAX_CONCURRENCY: int = 10  # Concurrent translations, each with its own DB session
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -99,6 +101,17 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = True
     ENABLE_TRACING: bool = False
     
+    @model_validator(mode="after")
+    def check_pool_fits_translation_concurrency(self) -> "Settings":
+        """Ensure the DB pool can serve every concurrent translation session."""
+        pool_capacity = self.DATABASE_POOL_SIZE + self.DATABASE_MAX_OVERFLOW
+        if self.TRANSLATION_MAX_CONCURRENCY >= pool_capacity:
+            raise ValueError(
+                "TRANSLATION_MAX_CONCURRENCY must be lower than "
+                "DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW"
+            )
+        return self
+    
 
 # Create global settings instance
 settings = Settings()
@@ -0,0 +1,17 @@
+"""Redis client.
+
+Provides the shared async Redis connection used for caching.
+"""
+
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+# Connections are opened lazily on first command. Redis only backs caches,
+# so connects and commands time out quickly rather than stalling requests
+redis_client = aioredis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+)
@@ -0,0 +1,145 @@
+"""Resilience helpers for calls to external AI providers.
+
+Provides retry with exponential backoff for transient errors and a simple
+circuit breaker that fails fast while a provider is down.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from abacusai import ApiException
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open."""
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Check whether an error is worth retrying.
+
+    Timeouts and connection errors (including those raised by the
+    requests-based Abacus.AI SDK, which subclass OSError) and Abacus.AI
+    5xx or 429 responses are transient.
+
+    Args:
+        exc: Raised exception
+
+    Returns:
+        True if the call may succeed when retried
+    """
+    if isinstance(exc, ApiException):
+        status = getattr(exc, "http_status", None) or 0
+        return status >= 500 or status == 429
+    return isinstance(exc, (TimeoutError, OSError))
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single external endpoint.
+
+    After failure_threshold consecutive transient failures the circuit
+    opens and calls fail immediately with CircuitOpenError. Once
+    reset_timeout seconds have passed, calls are let through again; the
+    next success closes the circuit and the next failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Endpoint name, used in logs and errors
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._opened_at is not None:
+            logger.info("Circuit %s closed", self.name)
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning("Circuit %s opened after %d failures", self.name, self._failures)
+            self._opened_at = time.monotonic()
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Call func with retries, unless the circuit is open.
+
+        Transient errors are retried up to 3 attempts with jittered
+        exponential backoff; only a call that still fails counts against
+        the breaker.
+
+        Args:
+            func: Async callable to invoke
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self.state == "open":
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_exponential_jitter(initial=0.2, max=2.0),
+                retry=retry_if_exception(is_transient_error),
+                reraise=True,
+            ):
+                with attempt:
+                    result = await func(*args, **kwargs)
+        except Exception as e:
+            if is_transient_error(e):
+                self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+
+# Breakers for the Abacus.AI endpoints used by the services
+image_generation_breaker = CircuitBreaker("abacus.generate_image")
+translation_breaker = CircuitBreaker("abacus.translate_text")
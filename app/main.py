@@ -15,8 +15,10 @@ from fastapi.responses import JSONResponse
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.redis_client import redis_client
 from app.db.session import engine
 from app.db.base import Base
+from app.services.service_integration import service_integration
 
 # Set up logging
 setup_logging()
@@ -41,6 +43,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME}...")
+    await service_integration.aclose()
+    await redis_client.aclose()
     await engine.dispose()
 
 
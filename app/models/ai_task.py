@@ -6,7 +6,7 @@ Tracks AI processing tasks for content generation, translation, and other AI ope
 import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     Boolean,
@@ -14,9 +14,11 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -75,12 +77,21 @@ class AITask(Base):
     """
     
     __tablename__ = "ai_tasks"
+    __table_args__ = (
+        Index("ix_ai_tasks_created_by_status", "created_by", "status"),
+        Index("ix_ai_tasks_task_type_status", "task_type", "status"),
+        Index(
+            "ix_ai_tasks_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
     
     # Override id to use UUID
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        server_default=text("(gen_random_uuid())"),
         index=True,
     )
     
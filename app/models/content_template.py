@@ -4,7 +4,7 @@ Stores reusable templates for AI content generation with variable placeholders.
 """
 
 from typing import List
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     ARRAY,
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -49,7 +50,7 @@ class ContentTemplate(Base):
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        server_default=text("(gen_random_uuid())"),
         index=True,
     )
     
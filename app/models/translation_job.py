@@ -5,14 +5,16 @@ Tracks AI translation tasks for multi-language content support.
 
 import enum
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -53,12 +55,15 @@ class TranslationJob(Base):
     """
     
     __tablename__ = "translation_jobs"
+    __table_args__ = (
+        Index("ix_translation_jobs_task_status", "task_id", "status"),
+    )
     
     # Override id to use UUID
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        server_default=text("(gen_random_uuid())"),
         index=True,
     )
     
@@ -25,31 +25,72 @@ class AITaskService:
         db: AsyncSession,
         task_data: AITaskCreate,
         created_by: UUID,
+        initial_status: TaskStatus = TaskStatus.PENDING,
     ) -> AITask:
         """Create a new AI task.
         
+        The task is flushed so its ID is available, but not committed; the
+        caller owns the transaction.
+        
         Args:
             db: Database session
             task_data: Task creation data
             created_by: User ID creating the task
+            initial_status: Status the task is inserted with
             
         Returns:
             Created AI task
         """
         task = AITask(
             task_type=task_data.task_type,
-            status=TaskStatus.PENDING,
+            status=initial_status,
             input_data=task_data.input_data,
             prompt=task_data.prompt,
             requires_approval=task_data.requires_approval,
             created_by=created_by,
         )
         db.add(task)
-        await db.commit()
-        await db.refresh(task)
+        await db.flush()
         logger.info(f"Created AI task {task.id} of type {task.task_type}")
         return task
     
+    @staticmethod
+    async def bulk_create_tasks(
+        db: AsyncSession,
+        tasks_data: List[AITaskCreate],
+        created_by: UUID,
+        initial_status: TaskStatus = TaskStatus.PENDING,
+    ) -> List[AITask]:
+        """Create several AI tasks with a single flush.
+        
+        Like create_task, the tasks are flushed but not committed; the
+        caller owns the transaction.
+        
+        Args:
+            db: Database session
+            tasks_data: Task creation data for each task
+            created_by: User ID creating the tasks
+            initial_status: Status the tasks are inserted with
+            
+        Returns:
+            Created AI tasks, in the order of tasks_data
+        """
+        tasks = [
+            AITask(
+                task_type=task_data.task_type,
+                status=initial_status,
+                input_data=task_data.input_data,
+                prompt=task_data.prompt,
+                requires_approval=task_data.requires_approval,
+                created_by=created_by,
+            )
+            for task_data in tasks_data
+        ]
+        db.add_all(tasks)
+        await db.flush()
+        logger.info(f"Created {len(tasks)} AI tasks")
+        return tasks
+    
     @staticmethod
     async def get_task(db: AsyncSession, task_id: UUID) -> Optional[AITask]:
         """Get AI task by ID.
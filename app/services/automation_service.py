@@ -4,9 +4,10 @@ Provides automated content generation workflows.
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
-from uuid import UUID
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -46,7 +47,13 @@ class AutomationService:
     
     # In-memory storage for workflows (should be in database in production)
     _workflows: Dict[UUID, AutomationWorkflow] = {}
+    # Slim execution status rows are kept indefinitely; the bulky result/error
+    # payloads are kept separately, in completion order, and dropped once
+    # they are older than PAYLOAD_RETENTION.
     _workflow_history: List[Dict] = []
+    _workflow_payloads: "OrderedDict[str, Tuple[datetime, Dict]]" = OrderedDict()
+    
+    PAYLOAD_RETENTION = timedelta(days=30)
     
     @staticmethod
     async def create_workflow(
@@ -70,8 +77,6 @@ class AutomationService:
         Returns:
             Created workflow info
         """
-        from uuid import uuid4
-        
         workflow_id = uuid4()
         workflow = AutomationWorkflow(
             id=workflow_id,
@@ -191,8 +196,8 @@ class AutomationService:
             raise ValueError(f"Workflow {workflow_id} is not active")
         
         # Execute workflow based on type
-        execution_id = str(UUID())
-        start_time = datetime.utcnow()
+        execution_id = str(uuid4())
+        started_at = datetime.now(timezone.utc).isoformat()
         
         try:
             if workflow.workflow_type == "auto_translate":
@@ -207,31 +212,87 @@ class AutomationService:
                 result = {"message": "Workflow type not implemented"}
             
             # Record execution
+            completed_at = datetime.now(timezone.utc)
             execution_record = {
                 "execution_id": execution_id,
                 "workflow_id": str(workflow_id),
-                "started_at": start_time.isoformat(),
-                "completed_at": datetime.utcnow().isoformat(),
+                "started_at": started_at,
+                "completed_at": completed_at.isoformat(),
                 "status": "completed",
-                "result": result,
             }
-            AutomationService._workflow_history.append(execution_record)
-            
-            return execution_record
+            return AutomationService._record_execution(
+                execution_record, {"result": result}, completed_at
+            )
             
         except Exception as e:
             logger.error(f"Workflow execution error: {e}")
+            completed_at = datetime.now(timezone.utc)
             execution_record = {
                 "execution_id": execution_id,
                 "workflow_id": str(workflow_id),
-                "started_at": start_time.isoformat(),
-                "completed_at": datetime.utcnow().isoformat(),
+                "started_at": started_at,
+                "completed_at": completed_at.isoformat(),
                 "status": "failed",
-                "error": str(e),
             }
-            AutomationService._workflow_history.append(execution_record)
+            AutomationService._record_execution(
+                execution_record, {"error": str(e)}, completed_at
+            )
             raise
     
+    @staticmethod
+    def _record_execution(
+        execution_record: Dict,
+        payload: Dict,
+        completed_at: datetime,
+    ) -> Dict:
+        """Store an execution status row and its payload.
+        
+        Args:
+            execution_record: Status fields of the execution
+            payload: Bulky execution output ('result' or 'error')
+            completed_at: Completion time of the execution (UTC)
+            
+        Returns:
+            The full execution record including the payload
+        """
+        AutomationService._workflow_history.append(execution_record)
+        AutomationService._workflow_payloads[execution_record["execution_id"]] = (
+            completed_at,
+            payload,
+        )
+        AutomationService.prune_workflow_payloads(completed_at)
+        return {**execution_record, **payload}
+    
+    @staticmethod
+    def prune_workflow_payloads(now: Optional[datetime] = None) -> int:
+        """Drop execution payloads older than PAYLOAD_RETENTION.
+        
+        Status rows in the history are kept; only their result/error payloads
+        are removed.
+        
+        Args:
+            now: Reference time, timezone-aware (defaults to the current UTC time)
+            
+        Returns:
+            Number of payloads dropped
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - AutomationService.PAYLOAD_RETENTION
+        payloads = AutomationService._workflow_payloads
+        
+        dropped = 0
+        # Payloads are stored in completion order, so stop at the first one
+        # still inside the retention window.
+        while payloads:
+            execution_id, (completed_at, _) = next(iter(payloads.items()))
+            if completed_at >= cutoff:
+                break
+            del payloads[execution_id]
+            dropped += 1
+        
+        if dropped:
+            logger.info(f"Pruned {dropped} workflow execution payloads")
+        return dropped
+    
     @staticmethod
     async def _execute_auto_translate(
         db: AsyncSession,
@@ -246,10 +307,12 @@ class AutomationService:
         if not content_id:
             raise ValueError("content_id required for auto_translate workflow")
         
-        from uuid import UUID as parse_uuid
+        if not isinstance(content_id, UUID):
+            content_id = UUID(str(content_id))
+        
         result = await TranslationService.auto_translate_content(
             db=db,
-            content_id=parse_uuid(content_id),
+            content_id=content_id,
             target_languages=target_languages,
             created_by=created_by,
         )
@@ -282,9 +345,17 @@ class AutomationService:
         workflow_id: UUID,
         limit: int = 10,
     ) -> List[Dict]:
-        """Get workflow execution history."""
+        """Get workflow execution history.
+        
+        Executions whose payload has been pruned are returned without their
+        result/error.
+        """
         history = [
             record for record in AutomationService._workflow_history
             if record["workflow_id"] == str(workflow_id)
         ]
-        return history[-limit:]
+        payloads = AutomationService._workflow_payloads
+        return [
+            {**record, **payloads.get(record["execution_id"], (None, {}))[1]}
+            for record in history[-limit:]
+        ]
@@ -3,15 +3,18 @@
 Provides AI-powered content improvement capabilities.
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.abacus_client import abacus_client
-from app.models.ai_task import TaskStatus, TaskType
+from app.db.session import AsyncSessionLocal
+from app.models.ai_task import AITask, TaskStatus, TaskType
 from app.services.ai_task_service import AITaskService
 from app.schemas.ai_task import AITaskCreate
 
@@ -21,7 +24,7 @@ logger = logging.getLogger(__name__)
 class ContentEnhancementService:
     """Service for AI content enhancement."""
     
-    ENHANCEMENT_TYPES = ["grammar", "tone", "seo", "summarize", "improve"]
+    ENHANCEMENT_TYPES = frozenset({"grammar", "tone", "seo", "summarize", "improve"})
     
     @staticmethod
     async def enhance_content(
@@ -58,6 +61,7 @@ class ContentEnhancementService:
                 },
                 prompt="",
                 requires_approval=False,
+                created_by=created_by,
             ),
             created_by=created_by,
         )
@@ -67,17 +71,24 @@ class ContentEnhancementService:
         
         try:
             # Enhance content
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await abacus_client.enhance_text(
                 text=text,
                 enhancement_type=enhancement_type,
                 additional_context=context,
             )
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Update task
+            # The enhanced text is returned to the caller; only keep usage
+            # metadata on the task
             task.status = TaskStatus.COMPLETED
-            task.output_data = result
+            task.output_data = {
+                "tokens_used": result.get("tokens_used"),
+                "model_used": result.get("model_used"),
+                "changes_made": result.get("changes_made", []),
+            }
+            task.model_used = result.get("model_used")
             task.tokens_used = result.get("tokens_used")
             task.processing_time = processing_time
             
@@ -100,6 +111,130 @@ class ContentEnhancementService:
             await db.commit()
             raise
     
+    @staticmethod
+    async def enhance_content_multi(
+        db: AsyncSession,
+        text: str,
+        enhancement_types: List[str],
+        context: Optional[str],
+        created_by: UUID,
+    ) -> List[Dict]:
+        """Apply several enhancements to the same text concurrently.
+        
+        The AI task rows for all enhancements are inserted with a single
+        statement, then each enhancement runs in its own task with its own
+        database session (sessions can't be shared between concurrent
+        operations).
+        
+        Args:
+            db: Database session
+            text: Text to enhance
+            enhancement_types: Types of enhancement to apply
+            context: Additional context
+            created_by: User ID
+            
+        Returns:
+            Enhancement results in the order of enhancement_types; failed
+            enhancements have status "failed" and an 'error' key
+        """
+        for enhancement_type in enhancement_types:
+            if enhancement_type not in ContentEnhancementService.ENHANCEMENT_TYPES:
+                raise ValueError(f"Unsupported enhancement type: {enhancement_type}")
+        
+        # Create all AI tasks in one round trip
+        result = await db.execute(
+            insert(AITask).returning(AITask.id, sort_by_parameter_order=True),
+            [
+                {
+                    "task_type": TaskType.CONTENT_ENHANCEMENT,
+                    "status": TaskStatus.PROCESSING,
+                    "input_data": {
+                        "text": text,
+                        "enhancement_type": enhancement_type,
+                        "context": context,
+                    },
+                    "prompt": "",
+                    "requires_approval": False,
+                    "created_by": created_by,
+                }
+                for enhancement_type in enhancement_types
+            ],
+        )
+        task_ids = list(result.scalars().all())
+        await db.commit()
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    ContentEnhancementService._enhance_one(
+                        task_id, text, enhancement_type, context
+                    )
+                )
+                for task_id, enhancement_type in zip(task_ids, enhancement_types)
+            ]
+        
+        return [task.result() for task in tasks]
+    
+    @staticmethod
+    async def _enhance_one(
+        task_id: UUID,
+        text: str,
+        enhancement_type: str,
+        context: Optional[str],
+    ) -> Dict:
+        """Run one enhancement of enhance_content_multi in its own session."""
+        async with AsyncSessionLocal() as session:
+            try:
+                start_time = time.perf_counter()
+                result = await abacus_client.enhance_text(
+                    text=text,
+                    enhancement_type=enhancement_type,
+                    additional_context=context,
+                )
+                processing_time = time.perf_counter() - start_time
+            except Exception as e:
+                logger.error(f"Content enhancement error: {e}")
+                await session.execute(
+                    update(AITask)
+                    .where(AITask.id == task_id)
+                    .values(status=TaskStatus.FAILED, error_message=str(e))
+                )
+                await session.commit()
+                return {
+                    "task_id": str(task_id),
+                    "original_text": text,
+                    "enhancement_type": enhancement_type,
+                    "error": str(e),
+                    "status": "failed",
+                }
+            
+            await session.execute(
+                update(AITask)
+                .where(AITask.id == task_id)
+                .values(
+                    status=TaskStatus.COMPLETED,
+                    output_data={
+                        "tokens_used": result.get("tokens_used"),
+                        "model_used": result.get("model_used"),
+                        "changes_made": result.get("changes_made", []),
+                    },
+                    model_used=result.get("model_used"),
+                    tokens_used=result.get("tokens_used"),
+                    processing_time=processing_time,
+                )
+            )
+            await session.commit()
+        
+        logger.info(f"Enhanced content for task {task_id}")
+        return {
+            "task_id": str(task_id),
+            "original_text": text,
+            "enhanced_text": result["enhanced_text"],
+            "enhancement_type": enhancement_type,
+            "changes_made": result.get("changes_made", []),
+            "status": "completed",
+        }
+    
     @staticmethod
     async def fix_grammar(
         db: AsyncSession,
@@ -5,20 +5,50 @@ Provides AI-powered content generation for various content types.
 
 import logging
 import time
+from functools import lru_cache
 from typing import Dict, Optional
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.abacus_client import abacus_client
 from app.models.ai_task import AITask, TaskStatus, TaskType
 from app.models.generated_content import ContentType, GeneratedContent
+from app.schemas.ai_task import AITaskCreate
 from app.services.ai_task_service import AITaskService
 from app.services.content_template_service import ContentTemplateService
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _social_post_skeleton(
+    platform: str,
+    tone: str,
+    max_length: int,
+    include_hashtags: bool,
+) -> str:
+    """Build the social post prompt with a ``{topic}`` placeholder.
+    
+    Only the topic varies freely between calls, so the rest of the prompt is
+    cached per (platform, tone, max_length, include_hashtags) combination.
+    Braces in the cached values are escaped so ``str.format`` only fills
+    the topic.
+    """
+    platform = platform.replace("{", "{{").replace("}", "}}")
+    tone = tone.replace("{", "{{").replace("}", "}}")
+    hashtag_instruction = "Include 3-5 relevant hashtags at the end." if include_hashtags else ""
+    
+    return f"""Create an engaging {platform} post about: {{topic}}
+
+Tone: {tone}
+Maximum length: {max_length} characters
+{hashtag_instruction}
+
+Post:"""
+
+
 class ContentGenerationService:
     """Service for AI content generation."""
     
@@ -62,6 +92,7 @@ class ContentGenerationService:
                 },
                 prompt="",  # Will be set below
                 requires_approval=True,
+                created_by=created_by,
             ),
             created_by=created_by,
         )
@@ -90,42 +121,49 @@ class ContentGenerationService:
         
         try:
             # Generate content
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await abacus_client.generate_text(
                 prompt=prompt,
                 max_tokens=500,
                 temperature=0.7,
                 system_message="You are a social media expert creating engaging posts.",
             )
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
-            # Update task
+            # Update task; the generated text itself lives in GeneratedContent.body
             task.status = TaskStatus.COMPLETED
-            task.output_data = result
+            task.output_data = {
+                "tokens_used": result.get("tokens_used"),
+                "model_used": result.get("model_used"),
+            }
             task.model_used = result.get("model_used")
             task.tokens_used = result.get("tokens_used")
             task.processing_time = processing_time
             
-            # Create generated content
-            content = GeneratedContent(
-                task_id=task.id,
-                content_type=ContentType.SOCIAL_POST,
-                body=result["text"],
-                language="en",
-                platform=platform,
-                content_metadata={
-                    "tone": tone,
-                    "include_hashtags": include_hashtags,
-                },
-            )
-            db.add(content)
+            # Create generated content, reading the id back via RETURNING
+            content_id = (
+                await db.execute(
+                    insert(GeneratedContent)
+                    .values(
+                        task_id=task.id,
+                        content_type=ContentType.SOCIAL_POST,
+                        body=result["text"],
+                        language="en",
+                        platform=platform,
+                        content_metadata={
+                            "tone": tone,
+                            "include_hashtags": include_hashtags,
+                        },
+                    )
+                    .returning(GeneratedContent.id)
+                )
+            ).scalar_one()
             await db.commit()
-            await db.refresh(content)
             
             logger.info(f"Generated social post for task {task.id}")
             return {
                 "task_id": str(task.id),
-                "content_id": str(content.id),
+                "content_id": str(content_id),
                 "content": result["text"],
                 "status": "completed",
             }
@@ -146,15 +184,9 @@ class ContentGenerationService:
         include_hashtags: bool,
     ) -> str:
         """Build prompt for social post generation."""
-        hashtag_instruction = "Include 3-5 relevant hashtags at the end." if include_hashtags else ""
-        
-        return f"""Create an engaging {platform} post about: {topic}
-
-Tone: {tone}
-Maximum length: {max_length} characters
-{hashtag_instruction}
-
-Post:"""
+        return _social_post_skeleton(
+            platform, tone, max_length, include_hashtags
+        ).format(topic=topic)
     
     @staticmethod
     async def generate_article(
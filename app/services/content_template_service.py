@@ -8,7 +8,7 @@ import re
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.content_template import ContentTemplate
@@ -16,6 +16,9 @@ from app.schemas.content_template import ContentTemplateCreate, ContentTemplateU
 
 logger = logging.getLogger(__name__)
 
+# Matches {variable_name} placeholders, as rendered by str.format
+_VARIABLE_PATTERN = re.compile(r"\{([^}]+)\}")
+
 
 class ContentTemplateService:
     """Service for content template operations."""
@@ -26,8 +29,7 @@ class ContentTemplateService:
         
         Variables are in the format {variable_name}.
         """
-        pattern = r"\{([^}]+)\}"
-        matches = re.findall(pattern, template_text)
+        matches = _VARIABLE_PATTERN.findall(template_text)
         return list(set(matches))  # Remove duplicates
     
     @staticmethod
@@ -78,7 +80,9 @@ class ContentTemplateService:
     ) -> Optional[ContentTemplate]:
         """Get template by ID."""
         result = await db.execute(
-            select(ContentTemplate).where(ContentTemplate.id == template_id)
+            lambda_stmt(
+                lambda: select(ContentTemplate).where(ContentTemplate.id == template_id)
+            )
         )
         return result.scalar_one_or_none()
     
@@ -92,24 +96,29 @@ class ContentTemplateService:
         platform: Optional[str] = None,
         is_active: Optional[bool] = True,
     ) -> List[ContentTemplate]:
-        """List templates with filters."""
-        query = select(ContentTemplate)
+        """List templates with filters.
+        
+        Built as a lambda statement so the compiled SQL is cached per
+        combination of filters; filter values, offset and limit are sent as
+        bound parameters.
+        """
+        query = lambda_stmt(lambda: select(ContentTemplate))
         
         if template_type:
-            query = query.where(ContentTemplate.template_type == template_type)
+            query += lambda s: s.where(ContentTemplate.template_type == template_type)
         if language:
-            query = query.where(ContentTemplate.language == language)
+            query += lambda s: s.where(ContentTemplate.language == language)
         if platform:
-            query = query.where(ContentTemplate.platform == platform)
+            query += lambda s: s.where(ContentTemplate.platform == platform)
         if is_active is not None:
-            query = query.where(ContentTemplate.is_active == is_active)
+            query += lambda s: s.where(ContentTemplate.is_active == is_active)
         
-        query = query.offset(skip).limit(limit).order_by(
+        query += lambda s: s.offset(bindparam("skip")).limit(bindparam("limit")).order_by(
             ContentTemplate.usage_count.desc(),
             ContentTemplate.created_at.desc()
         )
         
-        result = await db.execute(query)
+        result = await db.execute(query, {"skip": skip, "limit": limit})
         return list(result.scalars().all())
     
     @staticmethod
@@ -202,13 +211,15 @@ class ContentTemplateService:
     ) -> List[ContentTemplate]:
         """Get template suggestions for a content type."""
         result = await db.execute(
-            select(ContentTemplate)
-            .where(
-                ContentTemplate.template_type == content_type,
-                ContentTemplate.language == language,
-                ContentTemplate.is_active == True,
+            lambda_stmt(
+                lambda: select(ContentTemplate)
+                .where(
+                    ContentTemplate.template_type == content_type,
+                    ContentTemplate.language == language,
+                    ContentTemplate.is_active == True,
+                )
+                .order_by(ContentTemplate.usage_count.desc())
+                .limit(5)
             )
-            .order_by(ContentTemplate.usage_count.desc())
-            .limit(5)
         )
         return list(result.scalars().all())
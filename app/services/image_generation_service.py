@@ -3,6 +3,7 @@
 Provides AI-powered image generation capabilities.
 """
 
+import hashlib
 import logging
 import time
 from typing import Dict, Optional
@@ -11,17 +12,32 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.abacus_client import abacus_client
+from app.core.cache import LRUCache, make_cache_key
+from app.core.redis_client import redis_client
+from app.core.resilience import image_generation_breaker
 from app.models.ai_task import TaskStatus, TaskType
 from app.services.ai_task_service import AITaskService
 from app.schemas.ai_task import AITaskCreate
 
 logger = logging.getLogger(__name__)
 
+# Recently generated images keyed by (size, style, prompt)
+_IMAGE_CACHE = LRUCache(maxsize=10_000)
+
+# Image URLs are shared across instances through Redis for 30 days
+_REDIS_IMAGE_TTL = 86400 * 30
+
+
+def _redis_image_key(prompt: str, size: str, style: Optional[str]) -> str:
+    """Build the Redis key for a generated image URL."""
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    return f"imggen:{size}:{style or '-'}:{prompt_hash}"
+
 
 class ImageGenerationService:
     """Service for AI image generation."""
     
-    SUPPORTED_SIZES = ["256x256", "512x512", "1024x1024", "1024x1792", "1792x1024"]
+    SUPPORTED_SIZES = frozenset({"256x256", "512x512", "1024x1024", "1024x1792", "1792x1024"})
     
     @staticmethod
     async def generate_image(
@@ -58,21 +74,38 @@ class ImageGenerationService:
                 },
                 prompt=prompt,
                 requires_approval=True,
+                created_by=created_by,
             ),
             created_by=created_by,
+            initial_status=TaskStatus.PROCESSING,
         )
         
-        task.status = TaskStatus.PROCESSING
-        await db.commit()
-        
         try:
-            # Generate image
-            start_time = time.time()
-            result = await abacus_client.generate_image(
-                prompt=prompt,
-                size=size,
-            )
-            processing_time = time.time() - start_time
+            # Generate image, reusing an identical earlier one if cached
+            cache_key = make_cache_key(size, style or "-", prompt)
+            redis_key = _redis_image_key(prompt, size, style)
+            cached = _IMAGE_CACHE.get(cache_key)
+            if cached is None:
+                cached_url = await ImageGenerationService._redis_get(redis_key)
+                if cached_url is not None:
+                    cached = {"image_url": cached_url}
+                    _IMAGE_CACHE.set(cache_key, cached)
+            
+            if cached is not None:
+                result = {**cached, "cached": True}
+                processing_time = 0.0
+            else:
+                start_time = time.perf_counter()
+                result = await image_generation_breaker.call(
+                    abacus_client.generate_image,
+                    prompt=prompt,
+                    size=size,
+                )
+                processing_time = time.perf_counter() - start_time
+                # Placeholders aren't real images; generate again next time
+                if not result.get("placeholder"):
+                    _IMAGE_CACHE.set(cache_key, dict(result))
+                    await ImageGenerationService._redis_set(redis_key, result["image_url"])
             
             # Update task
             task.status = TaskStatus.COMPLETED
@@ -81,7 +114,7 @@ class ImageGenerationService:
             
             await db.commit()
             
-            logger.info(f"Generated image for task {task.id}")
+            logger.info("Generated image for task %s", task.id)
             return {
                 "task_id": str(task.id),
                 "image_url": result["image_url"],
@@ -90,12 +123,29 @@ class ImageGenerationService:
             }
             
         except Exception as e:
-            logger.error(f"Image generation error: {e}")
+            logger.error("Image generation error: %s", e)
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
             await db.commit()
             raise
     
+    @staticmethod
+    async def _redis_get(key: str) -> Optional[str]:
+        """Look up a cached image URL, treating Redis errors as a miss."""
+        try:
+            return await redis_client.get(key)
+        except Exception as e:
+            logger.warning("Redis image cache lookup failed: %s", e)
+            return None
+    
+    @staticmethod
+    async def _redis_set(key: str, image_url: str) -> None:
+        """Cache an image URL, ignoring Redis errors."""
+        try:
+            await redis_client.set(key, image_url, ex=_REDIS_IMAGE_TTL)
+        except Exception as e:
+            logger.warning("Redis image cache update failed: %s", e)
+    
     @staticmethod
     async def generate_variations(
         db: AsyncSession,
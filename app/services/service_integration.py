@@ -8,12 +8,16 @@ from typing import Any, Dict, Optional
 from uuid import UUID
 
 import httpx
-from httpx import AsyncClient, Response
+import orjson
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Built once so the CA bundle isn't reloaded for every new connection;
+# http2=True advertises "h2" over ALPN so TLS connections can negotiate it
+_SSL_CONTEXT = httpx.create_ssl_context(http2=True)
+
 
 class ServiceIntegrationClient:
     """HTTP client for microservice integration."""
@@ -27,6 +31,23 @@ class ServiceIntegrationClient:
         self.notification_service_url = settings.NOTIFICATION_SERVICE_URL
         self.partners_crm_service_url = settings.PARTNERS_CRM_SERVICE_URL
         self.projects_service_url = settings.PROJECTS_SERVICE_URL
+        
+        # Shared client so keep-alive connections are reused across requests;
+        # HTTP/2 multiplexes concurrent requests to a host over one connection
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+            verify=_SSL_CONTEXT,
+        )
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        await self._client.aclose()
     
     async def _make_request(
         self,
@@ -35,23 +56,35 @@ class ServiceIntegrationClient:
         headers: Optional[Dict] = None,
         json: Optional[Dict] = None,
         auth_token: Optional[str] = None,
-    ) -> Response:
-        """Make HTTP request to a service."""
+    ) -> Any:
+        """Make HTTP request to a service.
+        
+        Request and response bodies are encoded and decoded with orjson.
+        
+        Returns:
+            Parsed JSON response body, or an empty dict if there is none
+        """
         if headers is None:
             headers = {}
         
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
         
-        async with AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=json,
-            )
-            response.raise_for_status()
-            return response
+        content = None
+        if json is not None:
+            content = orjson.dumps(json)
+            headers["Content-Type"] = "application/json"
+        
+        response = await self._client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=content,
+        )
+        response.raise_for_status()
+        if not response.content:
+            return {}
+        return orjson.loads(response.content)
     
     # Content Service Integration
     
@@ -71,16 +104,16 @@ class ServiceIntegrationClient:
         """
         try:
             url = f"{self.content_service_url}/api/v1/content"
-            response = await self._make_request(
+            data = await self._make_request(
                 method="POST",
                 url=url,
                 json=content_data,
                 auth_token=auth_token,
             )
             logger.info("Published content to Content Service")
-            return response.json()
+            return data
         except Exception as e:
-            logger.error(f"Error publishing to Content Service: {e}")
+            logger.error("Error publishing to Content Service: %s", e)
             raise
     
     # Social Media Service Integration
@@ -107,7 +140,7 @@ class ServiceIntegrationClient:
         """
         try:
             url = f"{self.social_media_service_url}/api/v1/posts"
-            response = await self._make_request(
+            data = await self._make_request(
                 method="POST",
                 url=url,
                 json={
@@ -118,10 +151,10 @@ class ServiceIntegrationClient:
                 },
                 auth_token=auth_token,
             )
-            logger.info(f"Published to {platform} via Social Media Service")
-            return response.json()
+            logger.info("Published to %s via Social Media Service", platform)
+            return data
         except Exception as e:
-            logger.error(f"Error publishing to Social Media Service: {e}")
+            logger.error("Error publishing to Social Media Service: %s", e)
             raise
     
     # Notification Service Integration
@@ -148,7 +181,7 @@ class ServiceIntegrationClient:
         """
         try:
             url = f"{self.notification_service_url}/api/v1/notifications"
-            response = await self._make_request(
+            data = await self._make_request(
                 method="POST",
                 url=url,
                 json={
@@ -160,9 +193,9 @@ class ServiceIntegrationClient:
                 auth_token=auth_token,
             )
             logger.info("Sent notification via Notification Service")
-            return response.json()
+            return data
         except Exception as e:
-            logger.error(f"Error sending via Notification Service: {e}")
+            logger.error("Error sending via Notification Service: %s", e)
             raise
     
     # Partners CRM Service Integration
@@ -183,14 +216,14 @@ class ServiceIntegrationClient:
         """
         try:
             url = f"{self.partners_crm_service_url}/api/v1/partners/{partner_id}"
-            response = await self._make_request(
+            data = await self._make_request(
                 method="GET",
                 url=url,
                 auth_token=auth_token,
             )
-            return response.json()
+            return data
         except Exception as e:
-            logger.error(f"Error fetching partner data: {e}")
+            logger.error("Error fetching partner data: %s", e)
             raise
     
     # Projects Service Integration
@@ -211,14 +244,14 @@ class ServiceIntegrationClient:
         """
         try:
             url = f"{self.projects_service_url}/api/v1/projects/{project_id}"
-            response = await self._make_request(
+            data = await self._make_request(
                 method="GET",
                 url=url,
                 auth_token=auth_token,
             )
-            return response.json()
+            return data
         except Exception as e:
-            logger.error(f"Error fetching project data: {e}")
+            logger.error("Error fetching project data: %s", e)
             raise
 
 
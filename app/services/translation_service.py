@@ -3,26 +3,40 @@
 Provides AI-powered translation capabilities.
 """
 
+import asyncio
 import logging
 import time
 from typing import Dict, List
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.abacus_client import abacus_client
+from app.core.cache import LRUCache, make_cache_key
+from app.core.config import settings
+from app.core.resilience import translation_breaker
+from app.db.session import AsyncSessionLocal
 from app.models.ai_task import AITask, TaskStatus, TaskType
+from app.models.generated_content import GeneratedContent
 from app.models.translation_job import TranslationJob, TranslationStatus
 from app.services.ai_task_service import AITaskService
 from app.schemas.ai_task import AITaskCreate
 
 logger = logging.getLogger(__name__)
 
+# Caps the number of concurrent translations sent to Abacus.AI; each holds
+# its own DB session, so this must stay below the connection pool capacity
+_BATCH_SEMAPHORE = asyncio.Semaphore(settings.TRANSLATION_MAX_CONCURRENCY)
+
+# Recent translations keyed by (source_lang, target_lang, text)
+_TRANSLATION_CACHE = LRUCache(maxsize=10_000)
+
 
 class TranslationService:
     """Service for AI translation."""
     
-    SUPPORTED_LANGUAGES = ["en", "es", "fr", "pt"]
+    SUPPORTED_LANGUAGES = frozenset({"en", "es", "fr", "pt"})
     
     @staticmethod
     async def translate(
@@ -62,8 +76,10 @@ class TranslationService:
                 },
                 prompt="",
                 requires_approval=False,
+                created_by=created_by,
             ),
             created_by=created_by,
+            initial_status=TaskStatus.PROCESSING,
         )
         
         # Create translation job
@@ -76,18 +92,26 @@ class TranslationService:
         )
         db.add(translation_job)
         
-        task.status = TaskStatus.PROCESSING
-        await db.commit()
-        
         try:
-            # Perform translation
-            start_time = time.time()
-            result = await abacus_client.translate_text(
-                text=text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-            )
-            processing_time = time.time() - start_time
+            # Perform translation, reusing an identical earlier one if cached
+            cache_key = make_cache_key(source_lang, target_lang, text)
+            cached = _TRANSLATION_CACHE.get(cache_key)
+            if cached is not None:
+                result = {**cached, "tokens_used": 0, "cached": True}
+                processing_time = 0.0
+            else:
+                start_time = time.perf_counter()
+                result = await translation_breaker.call(
+                    abacus_client.translate_text,
+                    text=text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                )
+                processing_time = time.perf_counter() - start_time
+                _TRANSLATION_CACHE.set(cache_key, {
+                    "translated_text": result["translated_text"],
+                    "quality_score": result.get("quality_score"),
+                })
             
             # Update records
             task.status = TaskStatus.COMPLETED
@@ -100,9 +124,8 @@ class TranslationService:
             translation_job.quality_score = result.get("quality_score")
             
             await db.commit()
-            await db.refresh(translation_job)
             
-            logger.info(f"Completed translation job {translation_job.id}")
+            logger.info("Completed translation job %s", translation_job.id)
             return {
                 "task_id": str(task.id),
                 "translation_id": str(translation_job.id),
@@ -112,7 +135,7 @@ class TranslationService:
             }
             
         except Exception as e:
-            logger.error(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             task.status = TaskStatus.FAILED
             task.error_message = str(e)
             translation_job.status = TranslationStatus.FAILED
@@ -127,35 +150,213 @@ class TranslationService:
         source_lang: str,
         target_lang: str,
         created_by: UUID,
+        strict_individual: bool = False,
     ) -> List[Dict]:
         """Batch translate multiple texts.
         
+        By default the whole batch is translated with batch_translate_fast.
+        With strict_individual, each text goes through translate() on its
+        own, concurrently and each in its own session.
+        
         Args:
             db: Database session
             texts: List of texts to translate
             source_lang: Source language
             target_lang: Target language
             created_by: User ID
+            strict_individual: Translate each text with a separate call
             
         Returns:
-            List of translation results
+            List of translation results, in the order of texts
         """
-        results = []
-        for text in texts:
+        if not strict_individual:
+            return await TranslationService.batch_translate_fast(
+                db=db,
+                texts=texts,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                created_by=created_by,
+            )
+        
+        async def _one(text: str) -> Dict:
             try:
-                result = await TranslationService.translate(
-                    db=db,
+                return await TranslationService._translate_in_own_session(
                     text=text,
                     source_lang=source_lang,
                     target_lang=target_lang,
                     created_by=created_by,
                 )
-                results.append(result)
             except Exception as e:
-                logger.error(f"Error in batch translation: {e}")
-                results.append({"error": str(e), "text": text})
+                logger.error("Error in batch translation: %s", e)
+                return {"error": str(e), "text": text}
         
-        return results
+        return list(await asyncio.gather(*(_one(text) for text in texts)))
+    
+    @staticmethod
+    async def batch_translate_fast(
+        db: AsyncSession,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        created_by: UUID,
+    ) -> List[Dict]:
+        """Batch translate texts with one Abacus.AI call and one transaction.
+        
+        The AI task and translation job rows for all texts are written with a
+        single flush. Texts found in the translation cache are served from
+        it, the rest are translated by one translate_batch call through the
+        translation circuit breaker, and the results are saved with a single
+        commit. If the call fails or returns the wrong number of results,
+        every job in the batch is marked failed.
+        
+        Args:
+            db: Database session
+            texts: List of texts to translate
+            source_lang: Source language
+            target_lang: Target language
+            created_by: User ID
+            
+        Returns:
+            List of translation results, in the order of texts
+        """
+        if source_lang not in TranslationService.SUPPORTED_LANGUAGES:
+            raise ValueError(f"Unsupported source language: {source_lang}")
+        if target_lang not in TranslationService.SUPPORTED_LANGUAGES:
+            raise ValueError(f"Unsupported target language: {target_lang}")
+        
+        if not texts:
+            return []
+        
+        tasks = []
+        translation_jobs = []
+        for text in texts:
+            task = AITask(
+                task_type=TaskType.TRANSLATION,
+                status=TaskStatus.PROCESSING,
+                input_data={
+                    "text": text,
+                    "source_lang": source_lang,
+                    "target_lang": target_lang,
+                },
+                prompt="",
+                requires_approval=False,
+                created_by=created_by,
+            )
+            tasks.append(task)
+            translation_jobs.append(
+                TranslationJob(
+                    task=task,
+                    source_language=source_lang,
+                    target_language=target_lang,
+                    source_text=text,
+                    status=TranslationStatus.PROCESSING,
+                )
+            )
+        db.add_all(tasks + translation_jobs)
+        await db.flush()
+        
+        # Serve cached texts, and send each distinct uncached text once
+        cache_keys = [make_cache_key(source_lang, target_lang, text) for text in texts]
+        cached = {
+            cache_key: entry
+            for cache_key in cache_keys
+            if (entry := _TRANSLATION_CACHE.get(cache_key)) is not None
+        }
+        missing = list(dict.fromkeys(
+            text for text, cache_key in zip(texts, cache_keys) if cache_key not in cached
+        ))
+        
+        processing_time = 0.0
+        try:
+            fetched = {}
+            if missing:
+                start_time = time.perf_counter()
+                batch_results = await translation_breaker.call(
+                    abacus_client.translate_batch,
+                    texts=missing,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                )
+                processing_time = time.perf_counter() - start_time
+                if len(batch_results) != len(missing):
+                    raise ValueError(
+                        f"Expected {len(missing)} translations, got {len(batch_results)}"
+                    )
+                fetched = dict(zip(missing, batch_results))
+        except Exception as e:
+            logger.error("Batch translation error: %s", e)
+            for task, translation_job in zip(tasks, translation_jobs):
+                task.status = TaskStatus.FAILED
+                task.error_message = str(e)
+                translation_job.status = TranslationStatus.FAILED
+                translation_job.error_message = str(e)
+            await db.commit()
+            return [{"error": str(e), "text": text} for text in texts]
+        
+        for text, result in fetched.items():
+            _TRANSLATION_CACHE.set(make_cache_key(source_lang, target_lang, text), {
+                "translated_text": result["translated_text"],
+                "quality_score": result.get("quality_score"),
+            })
+        
+        results = []
+        for text, cache_key, task, translation_job in zip(
+            texts, cache_keys, tasks, translation_jobs
+        ):
+            if cache_key in cached:
+                result = {**cached[cache_key], "tokens_used": 0, "cached": True}
+                task.processing_time = 0.0
+            else:
+                result = fetched[text]
+                task.processing_time = processing_time
+            results.append(result)
+            
+            task.status = TaskStatus.COMPLETED
+            task.tokens_used = result.get("tokens_used")
+            task.output_data = result
+            
+            translation_job.status = TranslationStatus.COMPLETED
+            translation_job.translated_text = result["translated_text"]
+            translation_job.quality_score = result.get("quality_score")
+        
+        await db.commit()
+        
+        logger.info(
+            "Completed batch of %d translation jobs (%d from cache)",
+            len(texts), sum(cache_key in cached for cache_key in cache_keys),
+        )
+        return [
+            {
+                "task_id": str(task.id),
+                "translation_id": str(translation_job.id),
+                "translated_text": result["translated_text"],
+                "quality_score": result.get("quality_score"),
+                "status": "completed",
+            }
+            for task, translation_job, result in zip(tasks, translation_jobs, results)
+        ]
+    
+    @staticmethod
+    async def _translate_in_own_session(
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        created_by: UUID,
+    ) -> Dict:
+        """Run translate() with its own session, bounded by _BATCH_SEMAPHORE.
+        
+        An AsyncSession can't be used by concurrent operations, so each
+        concurrently running translation gets a session of its own.
+        """
+        async with _BATCH_SEMAPHORE:
+            async with AsyncSessionLocal() as session:
+                return await TranslationService.translate(
+                    db=session,
+                    text=text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    created_by=created_by,
+                )
     
     @staticmethod
     async def auto_translate_content(
@@ -176,9 +377,6 @@ class TranslationService:
             Translation results for all languages
         """
         # Fetch content
-        from app.models.generated_content import GeneratedContent
-        from sqlalchemy import select
-        
         result = await db.execute(
             select(GeneratedContent).where(GeneratedContent.id == content_id)
         )
@@ -187,27 +385,41 @@ class TranslationService:
         if not content:
             raise ValueError(f"Content {content_id} not found")
         
-        # Translate to each target language
-        translations = {}
-        for target_lang in target_languages:
-            if target_lang == content.language:
-                continue  # Skip source language
-            
-            try:
-                translation = await TranslationService.translate(
-                    db=db,
-                    text=content.body,
-                    source_lang=content.language,
+        body, source_lang = content.body, content.language
+        
+        # End the read transaction so this session's connection goes back to
+        # the pool; otherwise every concurrent request would hold one while
+        # its translations wait for connections of their own
+        await db.commit()
+        
+        # Translate to each target language concurrently, skipping the source language
+        target_languages = [
+            target_lang for target_lang in dict.fromkeys(target_languages)
+            if target_lang != source_lang
+        ]
+        
+        results = await asyncio.gather(
+            *(
+                TranslationService._translate_in_own_session(
+                    text=body,
+                    source_lang=source_lang,
                     target_lang=target_lang,
                     created_by=created_by,
                 )
-                translations[target_lang] = translation
-            except Exception as e:
-                logger.error(f"Error translating to {target_lang}: {e}")
-                translations[target_lang] = {"error": str(e)}
+                for target_lang in target_languages
+            ),
+            return_exceptions=True,
+        )
+        
+        translations = {}
+        for target_lang, result in zip(target_languages, results):
+            if isinstance(result, Exception):
+                logger.error("Error translating to %s: %s", target_lang, result)
+                result = {"error": str(result)}
+            translations[target_lang] = result
         
         return {
             "content_id": str(content_id),
-            "source_language": content.language,
+            "source_language": source_lang,
             "translations": translations,
         }
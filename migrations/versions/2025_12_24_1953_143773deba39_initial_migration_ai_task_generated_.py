@@ -82,12 +82,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False),
     )
     
-    # Create indexes for ai_tasks
-    op.create_index('ix_ai_tasks_id', 'ai_tasks', ['id'])
-    op.create_index('ix_ai_tasks_task_type', 'ai_tasks', ['task_type'])
-    op.create_index('ix_ai_tasks_status', 'ai_tasks', ['status'])
-    op.create_index('ix_ai_tasks_created_by', 'ai_tasks', ['created_by'])
-    
     # Create generated_content table
     op.create_table(
         'generated_content',
@@ -107,14 +101,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False),
     )
     
-    # Create indexes for generated_content
-    op.create_index('ix_generated_content_id', 'generated_content', ['id'])
-    op.create_index('ix_generated_content_task_id', 'generated_content', ['task_id'])
-    op.create_index('ix_generated_content_content_type', 'generated_content', ['content_type'])
-    op.create_index('ix_generated_content_language', 'generated_content', ['language'])
-    op.create_index('ix_generated_content_platform', 'generated_content', ['platform'])
-    op.create_index('ix_generated_content_external_id', 'generated_content', ['external_id'])
-    
     # Create content_templates table
     op.create_table(
         'content_templates',
@@ -133,15 +119,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False),
     )
     
-    # Create indexes for content_templates
-    op.create_index('ix_content_templates_id', 'content_templates', ['id'])
-    op.create_index('ix_content_templates_name', 'content_templates', ['name'])
-    op.create_index('ix_content_templates_template_type', 'content_templates', ['template_type'])
-    op.create_index('ix_content_templates_language', 'content_templates', ['language'])
-    op.create_index('ix_content_templates_platform', 'content_templates', ['platform'])
-    op.create_index('ix_content_templates_is_active', 'content_templates', ['is_active'])
-    op.create_index('ix_content_templates_created_by', 'content_templates', ['created_by'])
-    
     # Create translation_jobs table
     op.create_table(
         'translation_jobs',
@@ -158,12 +135,38 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False),
     )
     
-    # Create indexes for translation_jobs
-    op.create_index('ix_translation_jobs_id', 'translation_jobs', ['id'])
-    op.create_index('ix_translation_jobs_task_id', 'translation_jobs', ['task_id'])
-    op.create_index('ix_translation_jobs_source_language', 'translation_jobs', ['source_language'])
-    op.create_index('ix_translation_jobs_target_language', 'translation_jobs', ['target_language'])
-    op.create_index('ix_translation_jobs_status', 'translation_jobs', ['status'])
+    # Create indexes outside the migration transaction so CONCURRENTLY can
+    # be used; it doesn't block writes when the tables already hold data
+    with op.get_context().autocommit_block():
+        # Indexes for ai_tasks
+        op.create_index('ix_ai_tasks_id', 'ai_tasks', ['id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ai_tasks_task_type', 'ai_tasks', ['task_type'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ai_tasks_status', 'ai_tasks', ['status'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_ai_tasks_created_by', 'ai_tasks', ['created_by'], postgresql_concurrently=True, if_not_exists=True)
+        
+        # Indexes for generated_content
+        op.create_index('ix_generated_content_id', 'generated_content', ['id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_generated_content_task_id', 'generated_content', ['task_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_generated_content_content_type', 'generated_content', ['content_type'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_generated_content_language', 'generated_content', ['language'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_generated_content_platform', 'generated_content', ['platform'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_generated_content_external_id', 'generated_content', ['external_id'], postgresql_concurrently=True, if_not_exists=True)
+        
+        # Indexes for content_templates
+        op.create_index('ix_content_templates_id', 'content_templates', ['id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_name', 'content_templates', ['name'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_template_type', 'content_templates', ['template_type'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_language', 'content_templates', ['language'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_platform', 'content_templates', ['platform'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_is_active', 'content_templates', ['is_active'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_templates_created_by', 'content_templates', ['created_by'], postgresql_concurrently=True, if_not_exists=True)
+        
+        # Indexes for translation_jobs
+        op.create_index('ix_translation_jobs_id', 'translation_jobs', ['id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_translation_jobs_task_id', 'translation_jobs', ['task_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_translation_jobs_source_language', 'translation_jobs', ['source_language'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_translation_jobs_target_language', 'translation_jobs', ['target_language'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_translation_jobs_status', 'translation_jobs', ['status'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
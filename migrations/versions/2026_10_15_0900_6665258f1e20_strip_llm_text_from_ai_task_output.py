@@ -0,0 +1,37 @@
+"""Strip generated text from old AI task output data
+
+Revision ID: 6665258f1e20
+Revises: 143773deba39
+Create Date: 2026-10-15 09:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6665258f1e20'
+down_revision = '143773deba39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+
+    # Generated text is kept in generated_content.body (or returned to the
+    # caller); drop the duplicated copy from tasks older than 30 days
+    op.execute(
+        """
+        UPDATE ai_tasks
+        SET output_data = output_data - 'text' - 'enhanced_text'
+        WHERE created_at < now() - interval '30 days'
+          AND output_data ?| array['text', 'enhanced_text']
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+
+    # The stripped text cannot be restored
+    pass
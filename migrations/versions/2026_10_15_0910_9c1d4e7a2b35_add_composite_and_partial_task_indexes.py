@@ -0,0 +1,64 @@
+"""Add composite and partial indexes on ai_tasks and translation_jobs
+
+Revision ID: 9c1d4e7a2b35
+Revises: 6665258f1e20
+Create Date: 2026-10-15 09:10:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1d4e7a2b35'
+down_revision = '6665258f1e20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+
+    # ix_ai_tasks_status is kept: status-only filters and the statistics
+    # GROUP BY can't use an index led by created_by or task_type
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ai_tasks_created_by_status', 'ai_tasks', ['created_by', 'status'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_ai_tasks_task_type_status', 'ai_tasks', ['task_type', 'status'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Only covers the pending queue, so it stays small as tasks complete
+        op.create_index(
+            'ix_ai_tasks_pending', 'ai_tasks', ['created_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_translation_jobs_task_status', 'translation_jobs', ['task_id', 'status'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_translation_jobs_task_status', table_name='translation_jobs',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_ai_tasks_pending', table_name='ai_tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_ai_tasks_task_type_status', table_name='ai_tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_ai_tasks_created_by_status', table_name='ai_tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,38 @@
+"""Generate UUID primary keys server-side
+
+Revision ID: e3a57c90d812
+Revises: 9c1d4e7a2b35
+Create Date: 2026-10-15 09:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a57c90d812'
+down_revision = '9c1d4e7a2b35'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['ai_tasks', 'generated_content', 'content_templates', 'translation_jobs']
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides
+    # it on older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+
+    # The extension is left installed; other objects may depend on it
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -1,12 +1,22 @@
 """Shared test fixtures for AI Service tests."""
+import asyncio
+import sys
+
 import pytest
-from typing import AsyncGenerator, Generator
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+import pytest_asyncio
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from httpx import ASGITransport, AsyncClient
+from pytest_asyncio import is_async_test
+from sqlalchemy import ARRAY, JSON, event
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core.abacus_client import AbacusAIClient, abacus_client
 from app.db.base_class import Base
 from app.db.session import get_db
 from app.core.config import settings
@@ -15,51 +25,192 @@ from app.core.security import create_access_token
 # Test database URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create async engine for testing
+# Create async engine for testing; StaticPool shares the single in-memory
+# database across every connection
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
 )
 
-TestingSessionLocal = sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+# The models use PostgreSQL column types; store them as JSON on SQLite
+test_engine.dialect.colspecs = {**test_engine.dialect.colspecs, ARRAY: JSON}
+
+
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_json_on_sqlite(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@compiles(PGUUID, "sqlite")
+def _compile_uuid_on_sqlite(type_, compiler, **kw) -> str:
+    # A column declared UUID gets NUMERIC affinity, which turns hex ids
+    # such as "1234e567..." into numbers
+    return "CHAR(32)"
+
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs actually roll back
+    # (pysqlite otherwise manages transactions on its own), and supply the
+    # models' server-side UUID default
+    dbapi_connection.isolation_level = None
+    dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid4().hex)
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _on_begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop.
+
+    Session-scoped async fixtures (the schema, connection and HTTP client
+    below) are bound to the session loop, so tests must share it.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the test event loop on uvloop where it is available."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create the test database schema once per test session."""
+    try:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        yield
+
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+    finally:
+        # Stop the aiosqlite worker thread so the interpreter can exit,
+        # even when creating the schema failed
+        await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_connection(db_schema: None) -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection and outer transaction for the whole session."""
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+
+        yield conn
+
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture
+async def test_db(db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session rolled back after the test.
+
+    The test runs inside a SAVEPOINT on the shared connection. The session
+    joins it in create_savepoint mode, so commits made by the code under
+    test only release nested SAVEPOINTs, and rolling back the outer one
+    discards everything the test wrote.
+    """
+    savepoint = await db_connection.begin_nested()
+    session = AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield session
+
+    await session.close()
+    if savepoint.is_active:
+        await savepoint.rollback()
 
 
-@pytest.fixture(scope="function")
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+class FakeAsyncSession:
+    """In-memory stand-in for AsyncSession.
 
-    async with TestingSessionLocal() as session:
-        yield session
+    Supports the add/flush/commit/get/delete calls the services make, for
+    tests that check formatting or client calls rather than SQL behaviour.
+    """
 
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    def __init__(self):
+        self.objects: Dict[Tuple[type, Any], Any] = {}
+        self._pending: List[Any] = []
 
+    def add(self, obj: Any) -> None:
+        self._pending.append(obj)
 
-@pytest.fixture(scope="function")
-async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    def add_all(self, objs: List[Any]) -> None:
+        self._pending.extend(objs)
+
+    async def flush(self) -> None:
+        for obj in self._pending:
+            if getattr(obj, "id", None) is None:
+                obj.id = uuid4()
+            self.objects[(type(obj), obj.id)] = obj
+        self._pending.clear()
+
+    async def commit(self) -> None:
+        await self.flush()
+
+    async def rollback(self) -> None:
+        self._pending.clear()
+
+    async def refresh(self, obj: Any) -> None:
+        pass
+
+    async def delete(self, obj: Any) -> None:
+        self.objects.pop((type(obj), obj.id), None)
+
+    async def get(self, model: type, ident: Any) -> Optional[Any]:
+        return self.objects.get((model, ident))
+
+    def list(self, model: type) -> List[Any]:
+        return [obj for (obj_type, _), obj in self.objects.items() if obj_type is model]
+
+
+@pytest.fixture
+def fake_db() -> FakeAsyncSession:
+    """Create an in-memory database session that never touches SQLite."""
+    return FakeAsyncSession()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def asgi_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one HTTP client for the ASGI app per test session.
+
+    Requests go straight to the app on the test event loop; use this
+    rather than fastapi.testclient.TestClient, which runs the app in a
+    separate thread and event loop.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def client(
+    asgi_client: AsyncClient,
+    test_db: AsyncSession,
+) -> AsyncGenerator[AsyncClient, None]:
     """Create test client with database override."""
     async def override_get_db():
         yield test_db
 
     app.dependency_overrides[get_db] = override_get_db
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    yield asgi_client
 
     app.dependency_overrides.clear()
 
@@ -71,22 +222,95 @@ def auth_headers() -> dict:
     return {"Authorization": f"Bearer {access_token}"}
 
 
-@pytest.fixture
-def mock_abacus_client(monkeypatch):
-    """Mock Abacus.AI client for testing."""
-    class MockAbacusClient:
-        async def generate_text(self, prompt: str, **kwargs) -> str:
-            return f"Generated: {prompt[:50]}"
+MOCK_IMAGE_URL = "https://images.unsplash.com/photo-1726758267577-f8ca9449ed6b?w=500&auto=format&fit=crop&q=60&ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxmZWF0dXJlZC1waG90b3MtZmVlZHw2NHx8fGVufDB8fHx8fA%3D%3D"
+
+
+class MockAbacusClient:
+    """Deterministic stand-in for AbacusAIClient.
+
+    Methods take the same arguments and return dicts with the same keys as
+    the real client.
+    """
+
+    async def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None,
+    ) -> dict:
+        return {
+            "text": f"Generated: {prompt[:50]}",
+            "tokens_used": len(prompt) // 4,
+            "model_used": "mock-model",
+        }
+
+    async def batch_generate(
+        self,
+        prompts: List[str],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+    ) -> List[dict]:
+        return [await self.generate_text(prompt, max_tokens, temperature) for prompt in prompts]
+
+    async def translate_text(self, text: str, source_lang: str, target_lang: str) -> dict:
+        return {
+            "translated_text": f"[{target_lang.upper()}] {text}",
+            "quality_score": 0.99,
+            "tokens_used": len(text) // 4,
+        }
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+    ) -> List[dict]:
+        return [await self.translate_text(text, source_lang, target_lang) for text in texts]
+
+    async def enhance_text(
+        self,
+        text: str,
+        enhancement_type: str,
+        additional_context: Optional[str] = None,
+    ) -> dict:
+        return {
+            "enhanced_text": f"Enhanced ({enhancement_type}): {text}",
+            "tokens_used": len(text) // 4,
+            "model_used": "mock-model",
+            "changes_made": ["Enhanced"],
+        }
+
+    async def generate_image(self, prompt: str, size: str = "1024x1024") -> dict:
+        return {"image_url": MOCK_IMAGE_URL, "size": size, "format": "jpg"}
+
 
-        async def translate_text(self, text: str, target_language: str, **kwargs) -> str:
-            return f"[{target_language.upper()}] {text}"
+@pytest.fixture(scope="session", autouse=True)
+def mock_abacus_client() -> Generator[AsyncMock, None, None]:
+    """Replace the global Abacus.AI client's methods for the whole session.
 
-        async def enhance_content(self, content: str, enhancement_type: str, **kwargs) -> str:
-            return f"Enhanced ({enhancement_type}): {content}"
+    The AsyncMock is built once. Its methods answer through
+    MockAbacusClient, so responses follow the inputs, and record their
+    calls for assertions.
+    """
+    canned = MockAbacusClient()
+    mock_client = AsyncMock(spec=AbacusAIClient)
+    with pytest.MonkeyPatch.context() as mp:
+        for name in (
+            "generate_text",
+            "batch_generate",
+            "translate_text",
+            "translate_batch",
+            "enhance_text",
+            "generate_image",
+        ):
+            method = getattr(mock_client, name)
+            method.side_effect = getattr(canned, name)
+            mp.setattr(abacus_client, name, method)
+        yield mock_client
 
-        async def generate_image(self, prompt: str, **kwargs) -> str:
-            return "https://images.unsplash.com/photo-1726758267577-f8ca9449ed6b?w=500&auto=format&fit=crop&q=60&ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxmZWF0dXJlZC1waG90b3MtZmVlZHw2NHx8fGVufDB8fHx8fA%3D%3D"
 
-    mock_client = MockAbacusClient()
-    monkeypatch.setattr("app.core.abacus_client.AbacusAIClient._instance", mock_client)
-    return mock_client
+@pytest.fixture(autouse=True)
+def reset_mock_abacus_client(mock_abacus_client: AsyncMock) -> None:
+    """Clear recorded calls before each test, keeping the canned responses."""
+    mock_abacus_client.reset_mock(return_value=False, side_effect=False)
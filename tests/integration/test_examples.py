@@ -1,7 +1,7 @@
 """Integration tests for example endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.example import ExampleModel
@@ -12,18 +12,18 @@ from app.services.example_service import ExampleService
 class TestExampleEndpoints:
     """Test example CRUD endpoints."""
     
-    def test_list_examples_requires_auth(self, client: TestClient):
+    async def test_list_examples_requires_auth(self, client: AsyncClient):
         """Test that listing examples requires authentication."""
-        response = client.get("/api/v1/examples/")
+        response = await client.get("/api/v1/examples/")
         assert response.status_code == 401
     
-    def test_list_examples_with_auth(self, client: TestClient, auth_headers: dict):
+    async def test_list_examples_with_auth(self, client: AsyncClient, auth_headers: dict):
         """Test listing examples with authentication."""
-        response = client.get("/api/v1/examples/", headers=auth_headers)
+        response = await client.get("/api/v1/examples/", headers=auth_headers)
         assert response.status_code == 200
         assert isinstance(response.json(), list)
     
-    def test_create_example(self, client: TestClient, auth_headers: dict):
+    async def test_create_example(self, client: AsyncClient, auth_headers: dict):
         """Test creating an example."""
         example_data = {
             "title": "Test Example",
@@ -31,7 +31,7 @@ class TestExampleEndpoints:
             "status": "active",
         }
         
-        response = client.post(
+        response = await client.post(
             "/api/v1/examples/",
             json=example_data,
             headers=auth_headers,
@@ -46,10 +46,10 @@ class TestExampleEndpoints:
         assert "id" in data
         assert "created_at" in data
     
-    def test_get_example(self, client: TestClient, auth_headers: dict):
+    async def test_get_example(self, client: AsyncClient, auth_headers: dict):
         """Test getting a specific example."""
         # Create an example first
-        create_response = client.post(
+        create_response = await client.post(
             "/api/v1/examples/",
             json={"title": "Test", "status": "active"},
             headers=auth_headers,
@@ -57,7 +57,7 @@ class TestExampleEndpoints:
         example_id = create_response.json()["id"]
         
         # Get the example
-        response = client.get(
+        response = await client.get(
             f"/api/v1/examples/{example_id}",
             headers=auth_headers,
         )
@@ -66,18 +66,18 @@ class TestExampleEndpoints:
         data = response.json()
         assert data["id"] == example_id
     
-    def test_get_nonexistent_example(self, client: TestClient, auth_headers: dict):
+    async def test_get_nonexistent_example(self, client: AsyncClient, auth_headers: dict):
         """Test getting a nonexistent example returns 404."""
-        response = client.get(
+        response = await client.get(
             "/api/v1/examples/99999",
             headers=auth_headers,
         )
         assert response.status_code == 404
     
-    def test_update_example(self, client: TestClient, auth_headers: dict):
+    async def test_update_example(self, client: AsyncClient, auth_headers: dict):
         """Test updating an example."""
         # Create an example
-        create_response = client.post(
+        create_response = await client.post(
             "/api/v1/examples/",
             json={"title": "Original", "status": "active"},
             headers=auth_headers,
@@ -86,7 +86,7 @@ class TestExampleEndpoints:
         
         # Update the example
         update_data = {"title": "Updated Title"}
-        response = client.put(
+        response = await client.put(
             f"/api/v1/examples/{example_id}",
             json=update_data,
             headers=auth_headers,
@@ -96,10 +96,10 @@ class TestExampleEndpoints:
         data = response.json()
         assert data["title"] == update_data["title"]
     
-    def test_delete_example(self, client: TestClient, auth_headers: dict):
+    async def test_delete_example(self, client: AsyncClient, auth_headers: dict):
         """Test deleting an example."""
         # Create an example
-        create_response = client.post(
+        create_response = await client.post(
             "/api/v1/examples/",
             json={"title": "To Delete", "status": "active"},
             headers=auth_headers,
@@ -107,7 +107,7 @@ class TestExampleEndpoints:
         example_id = create_response.json()["id"]
         
         # Delete the example
-        response = client.delete(
+        response = await client.delete(
             f"/api/v1/examples/{example_id}",
             headers=auth_headers,
         )
@@ -115,7 +115,7 @@ class TestExampleEndpoints:
         assert response.status_code == 204
         
         # Verify it's deleted
-        get_response = client.get(
+        get_response = await client.get(
             f"/api/v1/examples/{example_id}",
             headers=auth_headers,
         )
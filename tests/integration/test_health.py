@@ -1,16 +1,16 @@
 """Integration tests for health endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 
 @pytest.mark.integration
 class TestHealthEndpoints:
     """Test health check endpoints."""
     
-    def test_health_check(self, client: TestClient):
+    async def test_health_check(self, client: AsyncClient):
         """Test basic health check endpoint."""
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
         
         assert response.status_code == 200
         data = response.json()
@@ -20,9 +20,9 @@ class TestHealthEndpoints:
         assert "version" in data
         assert "timestamp" in data
     
-    def test_readiness_check(self, client: TestClient):
+    async def test_readiness_check(self, client: AsyncClient):
         """Test readiness check endpoint."""
-        response = client.get("/api/v1/ready")
+        response = await client.get("/api/v1/ready")
         
         assert response.status_code == 200
         data = response.json()
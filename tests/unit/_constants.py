@@ -0,0 +1,8 @@
+"""Constants shared by the unit tests."""
+from uuid import UUID
+
+# Passed as user_id to service calls
+TEST_USER = "test-user"
+
+# Used as created_by in schema payloads, which require a UUID
+TEST_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
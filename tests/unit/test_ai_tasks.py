@@ -1,134 +1,115 @@
 """Tests for AI task service."""
+from uuid import UUID
+
 import pytest
+import pytest_asyncio
 from app.services.ai_task_service import AITaskService
 from app.schemas.ai_task import (
     AITaskCreate,
     AITaskUpdate,
     TaskStatus,
 )
+from tests.unit._constants import TEST_USER_ID
+
+# Validated once at import; tests derive variants with model_copy, which
+# (like model_construct) skips validation
+_TASK_CONTENT_GEN = AITaskCreate(
+    task_type="content_generation",
+    input_data={"description": "Generate content", "priority": "high"},
+    created_by=TEST_USER_ID,
+)
+_TASK_TRANSLATION = AITaskCreate(
+    task_type="translation",
+    input_data={"description": "Translate content", "priority": "medium"},
+    created_by=TEST_USER_ID,
+)
 
+_ADMIN_ID = UUID("00000000-0000-0000-0000-0000000000ad")
 
-@pytest.fixture
-def task_service(test_db):
-    """Create AI task service instance."""
-    return AITaskService(test_db)
 
+@pytest_asyncio.fixture
+async def created_task(test_db):
+    """Create a task for the action tests."""
+    return await AITaskService.create_task(test_db, _TASK_CONTENT_GEN, created_by=TEST_USER_ID)
 
-@pytest.mark.asyncio
-async def test_create_task(task_service):
+
+async def test_create_task(test_db):
     """Test task creation."""
-    task_data = AITaskCreate(
-        task_type="content_generation",
-        description="Generate social media post",
-        priority="high",
-        metadata={"platform": "twitter", "topic": "Mission Update"},
+    task_data = _TASK_CONTENT_GEN.model_copy(
+        update={
+            "input_data": {
+                "description": "Generate social media post",
+                "priority": "high",
+                "platform": "twitter",
+                "topic": "Mission Update",
+            },
+        }
     )
 
-    task = await task_service.create_task(task_data, user_id="test-user")
+    task = await AITaskService.create_task(test_db, task_data, created_by=TEST_USER_ID)
 
     assert task is not None
     assert task.task_type == "content_generation"
     assert task.status == TaskStatus.PENDING
-    assert task.created_by == "test-user"
+    assert task.created_by == TEST_USER_ID
 
 
-@pytest.mark.asyncio
-async def test_get_task(task_service):
+async def test_get_task(test_db):
     """Test retrieving a task."""
     # Create task first
-    task_data = AITaskCreate(
-        task_type="translation",
-        description="Translate content",
-        priority="medium",
+    created_task = await AITaskService.create_task(
+        test_db, _TASK_TRANSLATION, created_by=TEST_USER_ID
     )
-    created_task = await task_service.create_task(task_data, user_id="test-user")
 
     # Retrieve task
-    task = await task_service.get_task(created_task.id)
+    task = await AITaskService.get_task(test_db, created_task.id)
 
     assert task is not None
     assert task.id == created_task.id
     assert task.task_type == "translation"
 
 
-@pytest.mark.asyncio
-async def test_update_task_status(task_service):
-    """Test updating task status."""
-    # Create task
-    task_data = AITaskCreate(
-        task_type="content_generation",
-        description="Generate article",
-        priority="low",
-    )
-    task = await task_service.create_task(task_data, user_id="test-user")
-
-    # Update status
-    update_data = AITaskUpdate(status=TaskStatus.IN_PROGRESS)
-    updated_task = await task_service.update_task(task.id, update_data)
-
-    assert updated_task.status == TaskStatus.IN_PROGRESS
-
-
-@pytest.mark.asyncio
-async def test_approve_task(task_service):
-    """Test task approval."""
-    # Create task
-    task_data = AITaskCreate(
-        task_type="content_generation",
-        description="Generate content",
-        priority="high",
-    )
-    task = await task_service.create_task(task_data, user_id="test-user")
-
-    # Approve task
-    approved_task = await task_service.approve_task(
-        task_id=task.id,
-        approved_by="admin-user",
-        comments="Looks good",
-    )
-
-    assert approved_task.status == TaskStatus.APPROVED
-    assert approved_task.approved_by == "admin-user"
-
-
-@pytest.mark.asyncio
-async def test_reject_task(task_service):
-    """Test task rejection."""
-    # Create task
-    task_data = AITaskCreate(
-        task_type="content_generation",
-        description="Generate content",
-        priority="high",
-    )
-    task = await task_service.create_task(task_data, user_id="test-user")
+@pytest.mark.parametrize(
+    "action,kwargs,expected_status",
+    [
+        ("update", {"task_data": AITaskUpdate(status=TaskStatus.PROCESSING)}, TaskStatus.PROCESSING),
+        ("approve", {"approved_by": _ADMIN_ID}, TaskStatus.PENDING),
+        ("reject", {"rejected_by": _ADMIN_ID, "reason": "Needs revision"}, TaskStatus.CANCELLED),
+    ],
+)
+async def test_task_action(test_db, created_task, action, kwargs, expected_status):
+    """Test that each task action moves the task to its expected status."""
+    action_method = getattr(AITaskService, f"{action}_task")
 
-    # Reject task
-    rejected_task = await task_service.reject_task(
-        task_id=task.id,
-        rejected_by="admin-user",
-        reason="Needs revision",
-    )
+    task = await action_method(test_db, created_task.id, **kwargs)
 
-    assert rejected_task.status == TaskStatus.REJECTED
+    assert task.status == expected_status
+    if action == "approve":
+        assert task.approved is True
+        assert task.approved_by == _ADMIN_ID
+    if action == "reject":
+        assert "Needs revision" in task.error_message
 
 
-@pytest.mark.asyncio
-async def test_get_task_statistics(task_service):
+async def test_get_task_statistics(test_db):
     """Test task statistics."""
-    # Create multiple tasks
-    for i in range(5):
-        task_data = AITaskCreate(
-            task_type="content_generation",
-            description=f"Task {i}",
-            priority="medium",
+    # Create multiple tasks in one batch
+    tasks_data = [
+        _TASK_CONTENT_GEN.model_copy(
+            update={"input_data": {"description": f"Task {i}", "priority": "medium"}}
         )
-        await task_service.create_task(task_data, user_id="test-user")
+        for i in range(5)
+    ]
+    tasks = await AITaskService.bulk_create_tasks(test_db, tasks_data, created_by=TEST_USER_ID)
+
+    assert len(tasks) == 5
+    assert len({task.id for task in tasks} - {None}) == 5
+    assert [task.input_data["description"] for task in tasks] == [f"Task {i}" for i in range(5)]
+    assert all(task.status == TaskStatus.PENDING for task in tasks)
 
     # Get statistics
-    stats = await task_service.get_task_statistics(user_id="test-user")
+    stats = await AITaskService.get_task_statistics(test_db, created_by=TEST_USER_ID)
 
-    assert stats is not None
-    assert "total" in stats
-    assert stats["total"] == 5
-    assert "by_status" in stats
-    assert "by_type" in stats
+    assert stats["total_tasks"] == 5
+    assert stats["by_status"] == {str(TaskStatus.PENDING): 5}
+    assert sum(stats["by_type"].values()) == 5
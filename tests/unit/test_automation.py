@@ -0,0 +1,75 @@
+"""Tests for automation service."""
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.automation_service import AutomationService
+
+_NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+_WORKFLOW_ID = uuid4()
+
+
+@pytest.fixture(autouse=True)
+def empty_workflow_history(monkeypatch):
+    """Give every test its own execution history and payload store."""
+    monkeypatch.setattr(AutomationService, "_workflow_history", [])
+    monkeypatch.setattr(AutomationService, "_workflow_payloads", OrderedDict())
+
+
+def _record(age: timedelta) -> str:
+    """Record a completed execution that finished ``age`` before _NOW."""
+    execution_id = str(uuid4())
+    completed_at = _NOW - age
+    AutomationService._record_execution(
+        {
+            "execution_id": execution_id,
+            "workflow_id": str(_WORKFLOW_ID),
+            "completed_at": completed_at.isoformat(),
+            "status": "completed",
+        },
+        {"result": {"execution": execution_id}},
+        completed_at,
+    )
+    return execution_id
+
+
+async def test_prune_workflow_payloads_drops_only_expired_payloads():
+    """Test that old payloads are cleared while every status row is kept."""
+    retention = AutomationService.PAYLOAD_RETENTION
+    # Recording prunes relative to the newest completion, which keeps all
+    # four payloads here; pruning at _NOW expires the first two
+    expired = [_record(retention + timedelta(days=2)), _record(retention + timedelta(days=1))]
+    recent = [_record(retention - timedelta(days=1)), _record(retention - timedelta(days=2))]
+    assert len(AutomationService._workflow_payloads) == 4
+
+    dropped = AutomationService.prune_workflow_payloads(_NOW)
+
+    assert dropped == 2
+    assert list(AutomationService._workflow_payloads) == recent
+
+    history = await AutomationService.get_workflow_history(_WORKFLOW_ID)
+    assert [record["execution_id"] for record in history] == expired + recent
+    for record in history:
+        assert record["status"] == "completed"
+        if record["execution_id"] in recent:
+            assert record["result"] == {"execution": record["execution_id"]}
+        else:
+            assert "result" not in record
+
+
+def test_prune_workflow_payloads_keeps_recent_payloads():
+    """Test that nothing inside the retention window is dropped."""
+    recent = [_record(timedelta(days=1)), _record(timedelta(0))]
+
+    assert AutomationService.prune_workflow_payloads(_NOW) == 0
+    assert list(AutomationService._workflow_payloads) == recent
+
+
+def test_prune_workflow_payloads_is_idempotent():
+    """Test that a second prune at the same time drops nothing more."""
+    _record(AutomationService.PAYLOAD_RETENTION + timedelta(days=1))
+
+    assert AutomationService.prune_workflow_payloads(_NOW) == 1
+    assert AutomationService.prune_workflow_payloads(_NOW) == 0
@@ -0,0 +1,45 @@
+"""Unit tests for caching utilities."""
+
+from app.core.cache import LRUCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Test cache key construction."""
+
+    def test_same_parts_same_key(self):
+        """Test that identical parts produce identical keys."""
+        assert make_cache_key("en", "es", "Hello") == make_cache_key("en", "es", "Hello")
+
+    def test_different_parts_different_key(self):
+        """Test that different parts produce different keys."""
+        assert make_cache_key("en", "es", "Hello") != make_cache_key("en", "fr", "Hello")
+
+
+class TestLRUCache:
+    """Test the LRU cache."""
+
+    def test_get_missing_returns_none(self):
+        """Test that a missing key returns None."""
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", {"translated_text": "Hola"})
+
+        assert cache.get("a") == {"translated_text": "Hola"}
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
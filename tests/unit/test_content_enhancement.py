@@ -0,0 +1,125 @@
+"""Tests for content enhancement service."""
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.ai_task import AITask, TaskStatus
+from app.services import content_enhancement_service
+from app.services.content_enhancement_service import ContentEnhancementService
+from tests.unit._constants import TEST_USER_ID
+
+_TEXT = "Our mission team served twenty families this week"
+_ENHANCEMENT_TYPES = ["grammar", "tone", "seo"]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    """Back AsyncSessionLocal with a pooled file database.
+
+    Each concurrent enhancement opens its own session, so they need real
+    separate connections rather than the shared in-memory one.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'enhancement.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid4().hex)
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(content_enhancement_service, "AsyncSessionLocal", factory)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(AITask.__table__.create)
+
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+async def _enhance_multi(session_factory):
+    async with session_factory() as db:
+        return await ContentEnhancementService.enhance_content_multi(
+            db, _TEXT, _ENHANCEMENT_TYPES, None, TEST_USER_ID
+        )
+
+
+async def test_enhance_content_multi_runs_enhancements_concurrently(
+    session_factory, mock_abacus_client, monkeypatch
+):
+    """Test that every enhancement is dispatched before the first one finishes."""
+    latency = 0.05
+    starts = []
+
+    async def slow_enhance(text, enhancement_type, additional_context=None):
+        starts.append(time.perf_counter())
+        await asyncio.sleep(latency)
+        return {
+            "enhanced_text": f"Enhanced ({enhancement_type}): {text}",
+            "tokens_used": 12,
+            "model_used": "mock-model",
+            "changes_made": ["Enhanced"],
+        }
+
+    monkeypatch.setattr(mock_abacus_client.enhance_text, "side_effect", slow_enhance)
+
+    results = await _enhance_multi(session_factory)
+
+    assert [result["enhancement_type"] for result in results] == _ENHANCEMENT_TYPES
+    assert len(starts) == 3
+    assert max(starts) - min(starts) < latency
+
+
+async def test_enhance_content_multi_persists_every_enhancement(
+    session_factory, mock_abacus_client
+):
+    """Test that each enhancement's task row is completed with its usage data."""
+    results = await _enhance_multi(session_factory)
+
+    async with session_factory() as db:
+        tasks = {
+            str(task.id): task
+            for task in (await db.execute(select(AITask))).scalars()
+        }
+
+    assert set(tasks) == {result["task_id"] for result in results}
+    for result in results:
+        task = tasks[result["task_id"]]
+        assert task.status == TaskStatus.COMPLETED
+        assert task.input_data["enhancement_type"] == result["enhancement_type"]
+        assert task.output_data == {
+            "tokens_used": len(_TEXT) // 4,
+            "model_used": "mock-model",
+            "changes_made": ["Enhanced"],
+        }
+        assert task.processing_time is not None
+
+
+async def test_enhance_content_multi_failure_cancels_other_enhancements(
+    session_factory, mock_abacus_client, monkeypatch
+):
+    """Test that an unexpected error in one branch cancels the rest."""
+    cancelled = []
+
+    async def enhance(text, enhancement_type, additional_context=None):
+        if enhancement_type == "tone":
+            # Malformed reply: the missing 'enhanced_text' fails the branch
+            # after its own error handling
+            return {"tokens_used": 1, "model_used": "mock-model"}
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(enhancement_type)
+            raise
+
+    monkeypatch.setattr(mock_abacus_client.enhance_text, "side_effect", enhance)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await _enhance_multi(session_factory)
+
+    assert exc_info.group_contains(KeyError, match="enhanced_text")
+    assert sorted(cancelled) == ["grammar", "seo"]
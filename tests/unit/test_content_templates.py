@@ -1,158 +1,144 @@
 """Tests for content template service."""
-import pytest
+import time
+from uuid import uuid4
+
 from app.services.content_template_service import ContentTemplateService
 from app.schemas.content_template import (
     ContentTemplateCreate,
     ContentTemplateUpdate,
 )
+from tests.unit._constants import TEST_USER_ID
+
+# Validated once at import; tests derive variants with model_copy, which
+# (like model_construct) skips validation
+_TEMPLATE_SOCIAL_POST = ContentTemplateCreate(
+    name="Social Media Post Template",
+    template_type="social_post",
+    prompt_template="Check out our latest update: {topic}. {description} #{hashtag}",
+    variables=["topic", "description", "hashtag"],
+    created_by=TEST_USER_ID,
+)
 
 
-@pytest.fixture
-def template_service(test_db):
-    """Create content template service instance."""
-    return ContentTemplateService(test_db)
-
-
-@pytest.mark.asyncio
-async def test_create_template(template_service):
-    """Test template creation."""
-    template_data = ContentTemplateCreate(
-        name="Social Media Post Template",
-        content_type="social_post",
-        template_text="Check out our latest update: {{topic}}. {{description}} #{{hashtag}}",
-        variables=["topic", "description", "hashtag"],
-        category="social_media",
+async def test_template_lifecycle(test_db):
+    """Test creating, retrieving, updating and deleting one template."""
+    # Create
+    template = await ContentTemplateService.create_template(
+        test_db, _TEMPLATE_SOCIAL_POST, created_by=TEST_USER_ID
     )
 
-    template = await template_service.create_template(template_data, user_id="test-user")
-
     assert template is not None
     assert template.name == "Social Media Post Template"
     assert len(template.variables) == 3
-    assert template.created_by == "test-user"
+    assert template.created_by == TEST_USER_ID
 
+    # Retrieve
+    fetched = await ContentTemplateService.get_template(test_db, template.id)
 
-@pytest.mark.asyncio
-async def test_get_template(template_service):
-    """Test retrieving a template."""
-    # Create template
-    template_data = ContentTemplateCreate(
-        name="Test Template",
-        content_type="article",
-        template_text="Title: {{title}}\n\nContent: {{content}}",
-        variables=["title", "content"],
+    assert fetched is not None
+    assert fetched.id == template.id
+    assert fetched.name == "Social Media Post Template"
+
+    # Update
+    update_data = ContentTemplateUpdate(
+        name="Updated Template",
+        prompt_template="Updated content: {new_variable}",
     )
-    created_template = await template_service.create_template(template_data, user_id="test-user")
+    updated = await ContentTemplateService.update_template(test_db, template.id, update_data)
 
-    # Retrieve template
-    template = await template_service.get_template(created_template.id)
+    assert updated.name == "Updated Template"
+    assert updated.variables == ["new_variable"]
 
-    assert template is not None
-    assert template.id == created_template.id
-    assert template.name == "Test Template"
+    # Delete
+    assert await ContentTemplateService.delete_template(test_db, template.id) is True
+    assert await ContentTemplateService.get_template(test_db, template.id) is None
 
 
-@pytest.mark.asyncio
-async def test_apply_template(template_service):
+async def test_apply_template(test_db):
     """Test applying template with variables."""
     # Create template
-    template_data = ContentTemplateCreate(
-        name="Welcome Template",
-        content_type="email",
-        template_text="Hello {{name}}, welcome to {{organization}}!",
-        variables=["name", "organization"],
+    template_data = _TEMPLATE_SOCIAL_POST.model_copy(
+        update={
+            "name": "Welcome Template",
+            "template_type": "email",
+            "prompt_template": "Hello {name}, welcome to {organization}!",
+            "variables": ["name", "organization"],
+        }
+    )
+    template = await ContentTemplateService.create_template(
+        test_db, template_data, created_by=TEST_USER_ID
     )
-    template = await template_service.create_template(template_data, user_id="test-user")
 
     # Apply template
     variables = {
         "name": "John",
         "organization": "Mission Engadi",
     }
-    result = await template_service.apply_template(template.id, variables)
+    result = await ContentTemplateService.test_template(test_db, template.id, variables)
 
-    assert result is not None
-    assert "Hello John" in result
-    assert "Mission Engadi" in result
+    assert result == "Hello John, welcome to Mission Engadi!"
 
 
-@pytest.mark.asyncio
-async def test_list_templates(template_service):
+async def test_list_templates(test_db):
     """Test listing templates."""
-    # Create multiple templates
+    # Create multiple templates, one at a time since they share the
+    # test_db session
     for i in range(3):
-        template_data = ContentTemplateCreate(
-            name=f"Template {i}",
-            content_type="social_post",
-            template_text=f"Content {i}: {{{{topic}}}}",
-            variables=["topic"],
+        template_data = _TEMPLATE_SOCIAL_POST.model_copy(
+            update={
+                "name": f"Template {i}",
+                "prompt_template": f"Content {i}: {{topic}}",
+                "variables": ["topic"],
+            }
         )
-        await template_service.create_template(template_data, user_id="test-user")
+        await ContentTemplateService.create_template(test_db, template_data, created_by=TEST_USER_ID)
 
     # List templates
-    templates = await template_service.list_templates(
-        content_type="social_post",
+    templates = await ContentTemplateService.list_templates(
+        test_db,
         skip=0,
         limit=10,
+        template_type="social_post",
     )
 
     assert len(templates) == 3
 
 
-@pytest.mark.asyncio
-async def test_update_template(template_service):
-    """Test updating a template."""
-    # Create template
-    template_data = ContentTemplateCreate(
-        name="Original Template",
-        content_type="article",
-        template_text="Original content",
-        variables=[],
-    )
-    template = await template_service.create_template(template_data, user_id="test-user")
+async def test_update_missing_template(test_db):
+    """Test that updating an unknown template returns None."""
+    update_data = ContentTemplateUpdate(name="Updated Template")
 
-    # Update template
-    update_data = ContentTemplateUpdate(
-        name="Updated Template",
-        template_text="Updated content: {{new_variable}}",
-        variables=["new_variable"],
-    )
-    updated_template = await template_service.update_template(template.id, update_data)
+    assert await ContentTemplateService.update_template(test_db, uuid4(), update_data) is None
 
-    assert updated_template.name == "Updated Template"
-    assert "new_variable" in updated_template.variables
 
+async def test_delete_missing_template(test_db):
+    """Test that deleting an unknown template returns False."""
+    assert await ContentTemplateService.delete_template(test_db, uuid4()) is False
 
-@pytest.mark.asyncio
-async def test_delete_template(template_service):
-    """Test deleting a template."""
-    # Create template
-    template_data = ContentTemplateCreate(
-        name="To Delete",
-        content_type="social_post",
-        template_text="Content",
-        variables=[],
+
+async def test_suggest_templates(test_db):
+    """Test template suggestions."""
+    template = await ContentTemplateService.create_template(
+        test_db, _TEMPLATE_SOCIAL_POST, created_by=TEST_USER_ID
     )
-    template = await template_service.create_template(template_data, user_id="test-user")
 
-    # Delete template
-    result = await template_service.delete_template(template.id)
+    suggestions = await ContentTemplateService.get_template_suggestions(
+        test_db,
+        content_type="social_post",
+    )
 
-    assert result is True
+    assert [suggestion.id for suggestion in suggestions] == [template.id]
 
-    # Verify deletion
-    deleted_template = await template_service.get_template(template.id)
-    assert deleted_template is None
 
+def test_extract_variables_is_fast():
+    """Test that variable extraction stays cheap on repeated calls."""
+    template_text = "Hello {name}, welcome to {organization}! Your gift of {amount} helps {project}."
 
-@pytest.mark.asyncio
-async def test_suggest_templates(template_service, mock_abacus_client):
-    """Test template suggestions."""
-    suggestions = await template_service.suggest_templates(
-        content_type="social_post",
-        context="Mission updates for social media",
-    )
+    start = time.perf_counter()
+    for _ in range(10_000):
+        variables = ContentTemplateService.extract_variables(template_text)
+    elapsed = time.perf_counter() - start
 
-    assert suggestions is not None
-    assert "suggestions" in suggestions
-    assert len(suggestions["suggestions"]) > 0
+    assert sorted(variables) == ["amount", "name", "organization", "project"]
+    # Generous bound (this takes ~10ms); only catches gross regressions
+    assert elapsed < 1.0
@@ -0,0 +1,53 @@
+"""Unit tests for retry and circuit breaker helpers."""
+
+import pytest
+
+from app.core.resilience import CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker."""
+
+    async def test_retries_transient_errors(self):
+        """Test that a transient failure is retried until it succeeds."""
+        breaker = CircuitBreaker("test")
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise TimeoutError("timed out")
+            return "ok"
+
+        assert await breaker.call(flaky) == "ok"
+        assert len(calls) == 2
+        assert breaker.state == "closed"
+
+    async def test_does_not_retry_other_errors(self):
+        """Test that non-transient errors fail immediately."""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+        calls = []
+
+        async def invalid():
+            calls.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await breaker.call(invalid)
+
+        assert len(calls) == 1
+        assert breaker.state == "closed"
+
+    async def test_opens_after_threshold(self):
+        """Test that the circuit opens and then rejects calls."""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+
+        async def down():
+            raise ConnectionError("refused")
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(down)
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(down)
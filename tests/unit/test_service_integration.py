@@ -0,0 +1,31 @@
+"""Unit tests for the service integration client."""
+
+import ssl
+
+from app.services.service_integration import _SSL_CONTEXT, ServiceIntegrationClient
+
+
+def test_ssl_context_offers_h2_over_alpn():
+    """Test that the shared TLS context advertises HTTP/2 in its ClientHello."""
+    incoming, outgoing = ssl.MemoryBIO(), ssl.MemoryBIO()
+    tls = _SSL_CONTEXT.wrap_bio(incoming, outgoing, server_hostname="example.org")
+
+    try:
+        tls.do_handshake()
+    except ssl.SSLWantReadError:
+        pass  # The ClientHello has been written; no server is answering
+
+    # ALPN protocol list: length-prefixed "http/1.1" followed by "h2"
+    assert b"\x08http/1.1\x02h2" in outgoing.read()
+
+
+async def test_client_uses_shared_ssl_context_with_http2():
+    """Test that the pooled transport is HTTP/2-capable and reuses the context."""
+    client = ServiceIntegrationClient()
+    try:
+        pool = client._client._transport._pool
+
+        assert pool._http2 is True
+        assert pool._ssl_context is _SSL_CONTEXT
+    finally:
+        await client.aclose()
@@ -1,95 +1,197 @@
 """Tests for translation service."""
+import asyncio
+import time
+from uuid import uuid4
+
 import pytest
-from unittest.mock import AsyncMock, patch
-from app.services.translation_service import TranslationService
-from app.schemas.translation import (
-    TranslationRequest,
-    BatchTranslationRequest,
-)
-
-
-@pytest.fixture
-def translation_service(test_db):
-    """Create translation service instance."""
-    return TranslationService(test_db)
-
-
-@pytest.mark.asyncio
-async def test_translate_text(translation_service, mock_abacus_client):
-    """Test single text translation."""
-    request = TranslationRequest(
-        text="Hello, welcome to our mission",
-        source_language="en",
-        target_language="es",
-    )
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.models.ai_task import AITask, TaskStatus, TaskType
+from app.models.generated_content import ContentType, GeneratedContent
+from app.models.translation_job import TranslationJob, TranslationStatus
+from app.services import translation_service
+from app.services.translation_service import _TRANSLATION_CACHE, TranslationService
+from tests.unit._constants import TEST_USER_ID
 
-    result = await translation_service.translate_text(request, user_id="test-user")
+_TEXTS = ["Hello", "Welcome", "Thank you"]
 
-    assert result is not None
-    assert "translated_text" in result
-    assert "target_language" in result
-    assert result["target_language"] == "es"
-    assert "[ES]" in result["translated_text"]
 
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    """Start every test with an empty translation cache."""
+    _TRANSLATION_CACHE.clear()
+    yield
+    _TRANSLATION_CACHE.clear()
 
-@pytest.mark.asyncio
-async def test_batch_translation(translation_service, mock_abacus_client):
+
+async def test_batch_translate(fake_db, mock_abacus_client):
     """Test batch translation."""
-    request = BatchTranslationRequest(
-        texts=["Hello", "Welcome", "Thank you"],
-        source_language="en",
-        target_languages=["es", "fr"],
+    results = await TranslationService.batch_translate(
+        fake_db, _TEXTS, "en", "es", TEST_USER_ID
     )
 
-    result = await translation_service.translate_batch(request, user_id="test-user")
+    assert [result["translated_text"] for result in results] == [
+        "[ES] Hello",
+        "[ES] Welcome",
+        "[ES] Thank you",
+    ]
+    assert all(result["status"] == "completed" for result in results)
 
-    assert result is not None
-    assert "translations" in result
-    assert len(result["translations"]) == 3
 
+async def test_batch_translate_rejects_unsupported_language(fake_db, mock_abacus_client):
+    """Test that unsupported languages are rejected before any AI call."""
+    with pytest.raises(ValueError):
+        await TranslationService.batch_translate(fake_db, _TEXTS, "en", "xx", TEST_USER_ID)
 
-@pytest.mark.asyncio
-async def test_detect_language(translation_service, mock_abacus_client):
-    """Test language detection."""
-    text = "Bonjour, bienvenue à notre mission"
+    mock_abacus_client.translate_batch.assert_not_called()
 
-    result = await translation_service.detect_language(text)
 
-    assert result is not None
-    assert "language" in result
-    assert "confidence" in result
+async def test_batch_translate_fast_makes_one_call_per_batch(fake_db, mock_abacus_client):
+    """Test that each batch is one Abacus.AI call, with none per text."""
+    for target_lang in ("es", "fr"):
+        await TranslationService.batch_translate_fast(
+            fake_db, _TEXTS, "en", target_lang, TEST_USER_ID
+        )
 
+    assert mock_abacus_client.translate_batch.call_count == 2
+    assert mock_abacus_client.translate_text.call_count == 0
 
-@pytest.mark.asyncio
-async def test_auto_translate_workflow(translation_service, mock_abacus_client):
-    """Test auto-translation workflow."""
-    content_id = "test-content-123"
-    target_languages = ["es", "fr", "pt"]
 
-    result = await translation_service.auto_translate_workflow(
-        content_id=content_id,
-        target_languages=target_languages,
-        user_id="test-user",
+async def test_batch_translate_fast_serves_cached_texts(fake_db, mock_abacus_client):
+    """Test that cached texts are not sent to Abacus.AI again."""
+    await TranslationService.batch_translate_fast(
+        fake_db, ["Hello", "Welcome", "Hello"], "en", "es", TEST_USER_ID
+    )
+    results = await TranslationService.batch_translate_fast(
+        fake_db, ["Hello", "Thank you"], "en", "es", TEST_USER_ID
     )
 
-    assert result is not None
-    assert "workflow_id" in result
-    assert "status" in result
-    assert len(result["translations"]) == 3
+    sent = [call.kwargs["texts"] for call in mock_abacus_client.translate_batch.call_args_list]
+    assert sent == [["Hello", "Welcome"], ["Thank you"]]
+    assert [result["translated_text"] for result in results] == ["[ES] Hello", "[ES] Thank you"]
 
 
-@pytest.mark.asyncio
-async def test_translation_quality_check(translation_service, mock_abacus_client):
-    """Test translation quality scoring."""
-    original = "Hello, welcome to our mission"
-    translated = "Hola, bienvenido a nuestra misión"
+async def test_batch_translate_fast_fails_short_reply(
+    fake_db, mock_abacus_client, monkeypatch
+):
+    """Test that a reply missing results fails every job in the batch."""
+    async def short_reply(texts, source_lang, target_lang):
+        return [{"translated_text": "[ES] Hello", "quality_score": 0.99}]
 
-    quality_score = await translation_service.check_translation_quality(
-        original_text=original,
-        translated_text=translated,
-        source_language="en",
-        target_language="es",
+    monkeypatch.setattr(mock_abacus_client.translate_batch, "side_effect", short_reply)
+
+    results = await TranslationService.batch_translate_fast(
+        fake_db, _TEXTS, "en", "es", TEST_USER_ID
     )
 
-    assert quality_score is not None
-    assert 0 <= quality_score <= 1
+    assert all("error" in result for result in results)
+    assert {job.status for job in fake_db.list(TranslationJob)} == {TranslationStatus.FAILED}
+
+
+async def test_auto_translate_content_runs_languages_concurrently(test_db, monkeypatch):
+    """Test that auto-translation dispatches every target language at once."""
+    task = AITask(
+        task_type=TaskType.CONTENT_GENERATION,
+        status=TaskStatus.COMPLETED,
+        input_data={},
+        created_by=TEST_USER_ID,
+    )
+    test_db.add(task)
+    await test_db.flush()
+    content = GeneratedContent(
+        task_id=task.id,
+        content_type=ContentType.SOCIAL_POST,
+        body="Hello, welcome to our mission",
+        language="en",
+    )
+    test_db.add(content)
+    await test_db.flush()
+
+    # Spy on the per-language translation to record when each one starts
+    latency = 0.05
+    starts = []
+
+    async def slow_translate(text, source_lang, target_lang, created_by):
+        starts.append(time.perf_counter())
+        await asyncio.sleep(latency)
+        return {"translated_text": f"[{target_lang.upper()}] {text}", "status": "completed"}
+
+    monkeypatch.setattr(TranslationService, "_translate_in_own_session", slow_translate)
+
+    result = await TranslationService.auto_translate_content(
+        test_db, content.id, ["es", "fr", "pt", "en"], TEST_USER_ID
+    )
+
+    # The source language is skipped
+    assert set(result["translations"]) == {"es", "fr", "pt"}
+    assert result["translations"]["fr"]["translated_text"] == "[FR] Hello, welcome to our mission"
+
+    # All languages are dispatched before the first translation finishes
+    assert len(starts) == 3
+    assert max(starts) - min(starts) < latency
+
+
+async def test_auto_translate_content_concurrent_requests_share_small_pool(
+    tmp_path, monkeypatch
+):
+    """Test that concurrent requests don't starve their translations of connections.
+
+    The pool has room for the translation semaphore plus one connection, so
+    it only suffices if each request returns its own connection before
+    fanning out.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'translations.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=1,
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(translation_service, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(translation_service, "_BATCH_SEMAPHORE", asyncio.Semaphore(1))
+
+    select_one = text("SELECT 1")
+
+    async def translate_with_session(db, text, source_lang, target_lang, created_by):
+        # Check out a connection the way the real translate() does
+        await db.execute(select_one)
+        await asyncio.sleep(0.01)
+        return {"translated_text": f"[{target_lang.upper()}] {text}", "status": "completed"}
+
+    monkeypatch.setattr(TranslationService, "translate", translate_with_session)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(GeneratedContent.__table__.create)
+        content_ids = [uuid4(), uuid4()]
+        async with session_factory() as db:
+            db.add_all(
+                GeneratedContent(
+                    id=content_id,
+                    task_id=uuid4(),
+                    content_type=ContentType.SOCIAL_POST,
+                    body="Hello, welcome to our mission",
+                    language="en",
+                )
+                for content_id in content_ids
+            )
+            await db.commit()
+
+        async def auto_translate(content_id):
+            async with session_factory() as db:
+                return await TranslationService.auto_translate_content(
+                    db, content_id, ["es", "fr"], TEST_USER_ID
+                )
+
+        results = await asyncio.gather(*(auto_translate(cid) for cid in content_ids))
+    finally:
+        await engine.dispose()
+
+    for result in results:
+        assert result["translations"] == {
+            "es": {"translated_text": "[ES] Hello, welcome to our mission", "status": "completed"},
+            "fr": {"translated_text": "[FR] Hello, welcome to our mission", "status": "completed"},
+        }